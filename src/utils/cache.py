@@ -0,0 +1,138 @@
+"""
+Cache Utility for CDC Pipeline
+
+Provides a small thread-safe LRU cache with per-entry expiry, used to avoid
+repeating idempotent lookups against external services.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+# Marker distinguishing "not cached" from a cached None
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded cache whose entries expire a fixed time after they are stored.
+
+    When the cache is full, the least recently used entry is evicted.
+    """
+
+    __slots__ = ("maxsize", "ttl", "_timer", "_entries", "_lock")
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid after it is stored
+            timer: Clock returning seconds, used to stamp and expire entries
+
+        Raises:
+            ValueError: If maxsize is not positive or ttl is negative
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if ttl < 0:
+            raise ValueError("ttl must not be negative")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value, or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= self._timer():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = (self._timer() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, calling loader and caching its result on a miss.
+
+        The loader runs outside the lock, so concurrent misses for the same
+        key may each call it; the last result stored wins.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing the value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove every entry whose key matches predicate.
+
+        Args:
+            predicate: Callable returning True for keys to remove
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -5,14 +5,119 @@ Validates Avro schemas and ensures compatibility for schema evolution
 in the CDC pipeline.
 """
 
+import functools
+import hashlib
 import json
-from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Optional, Any, Protocol, Tuple
 from enum import Enum
 import logging
-import requests
+import sys
+import threading
+
+from src.utils.cache import TTLCache
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Avro type names accepted at the top level of a schema
+_VALID_TYPE_NAMES = frozenset(("record", "enum", "array", "map", "fixed"))
+
+# Keys every record field must define
+_REQUIRED_FIELD_KEYS = frozenset(("name", "type"))
+
+# Marker for a key absent from a schema, as opposed to one set to None
+_MISSING = object()
+
+# Documentation-only attributes left out of schema fingerprints
+_META_KEYS = frozenset(("doc", "aliases", "description"))
+
+# Fingerprint hasher; copying a primed context is cheaper than constructing one.
+# Always BLAKE2b-256 so fingerprints match across hosts regardless of which
+# optional packages are installed.
+_HASH_PROTOTYPE = hashlib.blake2b(digest_size=32)
+
+# Maximum number of compatibility results memoized per validator
+_COMPAT_CACHE_SIZE = 1024
+
+# Maximum number of Schema Registry read responses cached per validator
+_REGISTRY_CACHE_SIZE = 1024
+
+# Connection pooling and retries for Schema Registry HTTP sessions. Retries
+# apply to connection errors on idempotent requests only.
+_REGISTRY_POOL_CONNECTIONS = 10
+_REGISTRY_POOL_MAXSIZE = 50
+_REGISTRY_MAX_RETRIES = 3
+
+# Maximum number of registry URLs with a pooled session shared by their clients
+_SHARED_SESSION_CACHE_SIZE = 16
+
+# Shared registry sessions keyed by base URL, least recently used first
+_shared_sessions: "OrderedDict[str, requests.Session]" = OrderedDict()
+_shared_sessions_lock = threading.Lock()
+
+# Registry client caches: schema IDs never change, subject versions do
+_ID_CACHE_TTL = 3600.0
+_SUBJECT_CACHE_SIZE = 256
+_SUBJECT_CACHE_TTL = 30.0
+
+# Shared pool for overlapping independent Schema Registry round-trips
+_REGISTRY_FETCH_WORKERS = 10
+_REGISTRY_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_REGISTRY_FETCH_WORKERS, thread_name_prefix="schema-registry"
+)
+
+
+def _json_default(value: Any) -> str:
+    """
+    Encode values JSON has no type for when canonicalizing a schema.
+
+    Python callers may give bytes and fixed fields a bytes default. Avro's
+    JSON encoding maps each byte to the code point of the same value, so
+    such a default hashes like its JSON form.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value).decode("latin-1")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    def _canonical_json(obj: Any) -> bytes:
+        """Serialize obj to compact, key-sorted JSON bytes."""
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_SORT_KEYS)
+
+    def _dumps(obj: Any) -> str:
+        """Serialize obj to compact JSON text."""
+        return orjson.dumps(obj).decode()
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    _loads = orjson.loads
+else:  # pragma: no cover - exercised only without orjson installed
+    def _canonical_json(obj: Any) -> bytes:
+        """Serialize obj to compact, key-sorted JSON bytes."""
+        return json.dumps(
+            obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False,
+            default=_json_default
+        ).encode()
+
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+def _copy_json(obj: Any) -> Any:
+    """Deep-copy JSON data by round-tripping it through the JSON codec."""
+    return _loads(_dumps(obj))
+
 
 class CompatibilityMode(Enum):
     """Schema compatibility modes."""
@@ -29,12 +134,28 @@ class SchemaType(Enum):
     PROTOBUF = "PROTOBUF"
 
 
-class SchemaValidationError(Exception):
+class _LazyMessageError(Exception):
+    """
+    Exception whose message is formatted from a template only when rendered.
+
+    Raised as ``Error("Field '{}' is bad", name)``; a lone message is used
+    verbatim. The template and arguments are kept in ``args``, so the error
+    can be rebuilt with ``type(e)(*e.args)``.
+    """
+
+    def __str__(self) -> str:
+        if len(self.args) < 2:
+            return super().__str__()
+        template, *format_args = self.args
+        return template.format(*format_args)
+
+
+class SchemaValidationError(_LazyMessageError):
     """Raised when schema validation fails."""
     pass
 
 
-class SchemaCompatibilityError(Exception):
+class SchemaCompatibilityError(_LazyMessageError):
     """Raised when schema compatibility check fails."""
     pass
 
@@ -44,6 +165,639 @@ class SchemaRegistryError(Exception):
     pass
 
 
+# Compatibility failure messages, keyed by reason code
+_REASON_MESSAGES = {
+    "type_changed": "Schema type changed from {} to {}",
+    "field_removed": "Field '{}' removed without default value",
+    "field_added": "New field '{}' added without default value",
+    "field_missing": "Field '{}' removed in new schema",
+    "field_type_changed": "Field '{}' type changed incompatibly",
+}
+
+
+# Missing-namespace warning (an error in strict mode), formatted with the schema name
+_MISSING_NAMESPACE_MESSAGE = (
+    "Schema '{}' missing 'namespace' field. "
+    "Namespaces prevent naming conflicts and are strongly recommended. "
+    "Example: 'namespace': 'com.example.cdc'"
+)
+
+
+def _incompatible(reason: str, *args: Any) -> SchemaCompatibilityError:
+    """Build a SchemaCompatibilityError from a reason code and its arguments."""
+    return SchemaCompatibilityError(_REASON_MESSAGES[reason], *args)
+
+
+# Reader types each writer type may be promoted to (e.g., int -> long)
+_TYPE_PROMOTIONS = {
+    "int": frozenset(("long", "float", "double")),
+    "long": frozenset(("float", "double")),
+    "float": frozenset(("double",)),
+    "string": frozenset(("bytes",)),
+}
+
+_NO_PROMOTIONS: frozenset = frozenset()
+
+
+@functools.lru_cache(maxsize=1024)
+def _union_key(branches: Tuple[str, ...]) -> frozenset:
+    """Return a shared frozenset for a union's branches, so equal unions share one key."""
+    return frozenset(branches)
+
+
+def _type_cache_key(avro_type: Any) -> Any:
+    """
+    Return a hashable key for a primitive or primitive-union type.
+
+    Unions become frozensets so that branch order does not split cache
+    entries. Types containing inline definitions (dicts) return None.
+    """
+    if isinstance(avro_type, str):
+        return avro_type
+    if isinstance(avro_type, list) and all(isinstance(t, str) for t in avro_type):
+        return _union_key(tuple(avro_type))
+    return None
+
+
+def _sole_non_null(union: Any) -> Any:
+    """Return the other branch of a two-branch union with null, else None."""
+    if len(union) == 2:
+        first, second = union
+        if first == "null":
+            return second
+        if second == "null":
+            return first
+    return None
+
+
+def _types_compatible(new_type: Any, old_type: Any) -> bool:
+    """Check type compatibility, memoizing union lookups."""
+    # Primitive (or named) pair: an exact match or one promotion-table probe
+    if isinstance(new_type, str) and isinstance(old_type, str):
+        return new_type == old_type or new_type in _TYPE_PROMOTIONS.get(old_type, _NO_PROMOTIONS)
+
+    new_key = _type_cache_key(new_type)
+    old_key = _type_cache_key(old_type)
+
+    if new_key is not None and old_key is not None:
+        return _types_compatible_cached(new_key, old_key)
+
+    return _resolve_types(new_type, old_type)
+
+
+@functools.lru_cache(maxsize=1024)
+def _types_compatible_cached(new_key: Any, old_key: Any) -> bool:
+    """Memoized form of _resolve_types for hashable type keys."""
+    return _resolve_types(new_key, old_key)
+
+
+def _resolve_types(new_type: Any, old_type: Any) -> bool:
+    """
+    Check if a reader (new) type can read data written with a writer (old) type.
+
+    Unions may be given as lists or as frozensets (cache keys).
+    """
+    # Exact match
+    if new_type == old_type:
+        return True
+
+    new_is_union = isinstance(new_type, (list, frozenset))
+    old_is_union = isinstance(old_type, (list, frozenset))
+
+    # Handle union types
+    if new_is_union and old_is_union:
+        # Fast path: every old branch appears verbatim in the new union
+        if isinstance(new_type, frozenset) and isinstance(old_type, frozenset) and old_type <= new_type:
+            return True
+        # Otherwise each old branch must be readable by some new branch;
+        # any() stops at the first match, all() at the first unmatched branch
+        return all(any(_types_compatible(nt, ot) for nt in new_type) for ot in old_type)
+
+    # Handle nullable types (union with null)
+    if new_is_union:
+        branch = _sole_non_null(new_type)
+        if branch is not None:
+            return _types_compatible(branch, old_type)
+
+    if old_is_union:
+        branch = _sole_non_null(old_type)
+        if branch is not None:
+            return _types_compatible(new_type, branch)
+
+    # Type promotions (e.g., int -> long)
+    if isinstance(old_type, str) and isinstance(new_type, str):
+        return new_type in _TYPE_PROMOTIONS.get(old_type, _NO_PROMOTIONS)
+
+    return False
+
+
+def _strip_meta(node: Any) -> Any:
+    """
+    Return a copy of a schema without documentation-only attributes.
+
+    Field default values are data, not schema, and are copied untouched.
+    """
+    if isinstance(node, dict):
+        return {
+            key: value if key == "default" else _strip_meta(value)
+            for key, value in node.items()
+            if key not in _META_KEYS
+        }
+    if isinstance(node, list):
+        return [_strip_meta(item) for item in node]
+    return node
+
+
+def _intern_name(name: Any) -> Any:
+    """Intern a string name so equal names from different schemas are the same object."""
+    return sys.intern(name) if type(name) is str else name
+
+
+def _index_fields(schema: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Index a record schema's fields by name, preserving declaration order.
+
+    Names are interned, so probing one schema's index with another's keys
+    usually matches by identity without comparing string contents.
+    """
+    return {_intern_name(field["name"]): field for field in schema.get("fields", ())}
+
+
+def _validate_record(schema: Dict[str, Any]) -> None:
+    """
+    Apply the structural rules for record schemas.
+
+    Raises:
+        SchemaValidationError: If a record or nested record is invalid
+    """
+    # Nested record definitions (in field types, union branches, array items
+    # and map values) are walked with explicit stacks instead of recursion;
+    # field rules are checked inline
+    stack = [schema]
+    while stack:
+        record = stack.pop()
+        fields = record.get("fields")
+
+        if fields is None:
+            raise SchemaValidationError("Record schema must have 'fields' property")
+
+        if not isinstance(fields, list):
+            raise SchemaValidationError("Schema 'fields' must be a list")
+
+        for field in fields:
+            if not isinstance(field, dict):
+                raise SchemaValidationError("Field must be a dictionary")
+
+            # One subset test on the happy path; work out which key is
+            # missing only when one is
+            if not _REQUIRED_FIELD_KEYS <= field.keys():
+                if "name" not in field:
+                    raise SchemaValidationError("Field must have a 'name' property")
+                raise SchemaValidationError(
+                    "Field '{}' must have a 'type' property", field["name"]
+                )
+
+            # Find record definitions in the field type, through union
+            # branches, array items and map values
+            types = [field["type"]]
+            while types:
+                field_type = types.pop()
+                if isinstance(field_type, list):
+                    types.extend(field_type)
+                    continue
+                if not isinstance(field_type, dict):
+                    continue
+
+                nested_type = field_type.get("type")
+                if nested_type == "record":
+                    nested_name = field_type.get("name", _MISSING)
+                    if nested_name is _MISSING:
+                        raise SchemaValidationError(
+                            "Nested record in field '{}' missing required fields: ['name']",
+                            field["name"]
+                        )
+                    if not isinstance(nested_name, str):
+                        raise SchemaValidationError(
+                            "Nested record in field '{}' has a non-string name: {!r}",
+                            field["name"], nested_name
+                        )
+                    stack.append(field_type)
+                elif nested_type == "array" and "items" in field_type:
+                    types.append(field_type["items"])
+                elif nested_type == "map" and "values" in field_type:
+                    types.append(field_type["values"])
+
+
+_NO_FIELDS: Mapping[str, Dict[str, Any]] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class CanonicalSchema:
+    """
+    Pre-indexed, read-only view of a schema used by the compatibility checks.
+
+    Attributes:
+        schema_type: Top-level Avro type
+        name: Schema name
+        namespace: Schema namespace, if any
+        fields_by_name: Record fields keyed by name (empty for non-records)
+        fingerprint: Schema fingerprint, documentation attributes included
+    """
+
+    schema_type: Any
+    name: Optional[str]
+    namespace: Optional[str]
+    fields_by_name: Mapping[str, Dict[str, Any]]
+    fingerprint: str
+
+
+# A compatibility violation: a _REASON_MESSAGES code followed by its arguments
+_Violation = Tuple[Any, ...]
+
+
+def _backward_violation(new: CanonicalSchema, old: CanonicalSchema) -> Optional[_Violation]:
+    """
+    Find the first reason new cannot read data written with old.
+
+    Returns:
+        A (reason, *args) violation, or None if the schemas are compatible
+    """
+    # Check if it's the same schema type
+    if new.schema_type != old.schema_type:
+        return ("type_changed", old.schema_type, new.schema_type)
+
+    old_fields = old.fields_by_name
+    new_fields = new.fields_by_name
+
+    # Check that no fields were removed from old schema. The key-view subset
+    # test runs in C; the ordered scan only runs to name the first culprit.
+    if not old_fields.keys() <= new_fields.keys():
+        for field_name in old_fields:
+            if field_name not in new_fields:
+                return ("field_removed", field_name)
+
+    # Check that new fields have defaults. Every old field is present at
+    # this point, so comparing field counts is how added fields are
+    # detected: equal counts mean identical field sets, a larger count
+    # means fields were added and each needs a default. This guard keeps a
+    # schema with extra fields from being treated as identical to the old
+    # one; it is not a speed shortcut.
+    if len(new_fields) > len(old_fields):
+        for field_name, new_field in new_fields.items():
+            if field_name not in old_fields and "default" not in new_field:
+                return ("field_added", field_name)
+
+    return _field_type_violation(new_fields, old_fields)
+
+
+def _forward_violation(new: CanonicalSchema, old: CanonicalSchema) -> Optional[_Violation]:
+    """
+    Find the first reason old cannot read data written with new.
+
+    Returns:
+        A (reason, *args) violation, or None if the schemas are compatible
+    """
+    # Check if it's the same schema type
+    if new.schema_type != old.schema_type:
+        return ("type_changed", old.schema_type, new.schema_type)
+
+    old_fields = old.fields_by_name
+    new_fields = new.fields_by_name
+
+    # Check that no fields were removed from old schema
+    # (old readers expect all their fields to be present or have defaults)
+    if not old_fields.keys() <= new_fields.keys():
+        for field_name in old_fields:
+            if field_name not in new_fields:
+                return ("field_missing", field_name)
+
+    return _field_type_violation(new_fields, old_fields)
+
+
+def _field_type_violation(
+    new_fields: Mapping[str, Dict[str, Any]],
+    old_fields: Mapping[str, Dict[str, Any]]
+) -> Optional[_Violation]:
+    """Find the first field present in both schemas whose type changed incompatibly."""
+    for field_name, old_field in old_fields.items():
+        new_field = new_fields.get(field_name)
+        if new_field is None:
+            continue
+
+        # Check if field type changed; most fields are unchanged, and an
+        # equal type needs no resolution call
+        new_type = new_field["type"]
+        old_type = old_field["type"]
+        if new_type == old_type:
+            continue
+        if not _types_compatible(new_type, old_type):
+            return ("field_type_changed", field_name)
+
+    return None
+
+
+class SchemaRegistryClientProtocol(Protocol):
+    """
+    Operations SchemaValidator needs from a Schema Registry client.
+
+    A client that caches its own reads can set a truthy caches_reads class
+    attribute; SchemaValidator then leaves read caching to it.
+    """
+
+    def get_schema_by_id(self, schema_id: int) -> Dict[str, Any]: ...
+
+    def get_latest_schema_version(self, subject: str) -> Tuple[int, Dict[str, Any]]: ...
+
+    def get_all_versions(self, subject: str) -> List[Tuple[int, Dict[str, Any]]]: ...
+
+    def register_schema(self, subject: str, schema: Dict[str, Any]) -> int: ...
+
+    def test_compatibility(self, subject: str, schema: Dict[str, Any]) -> bool: ...
+
+    def get_schema_by_version(self, subject: str, version: int) -> Dict[str, Any]: ...
+
+    def list_subjects(self) -> List[str]: ...
+
+    def delete_schema_version(self, subject: str, version: int) -> bool: ...
+
+    def get_compatibility(self, subject: str) -> str: ...
+
+    def set_compatibility(self, subject: str, level: str) -> bool: ...
+
+
+def _response_json(response: Any) -> Any:
+    """
+    Decode a registry response body.
+
+    Uses orjson on the raw bytes when available, skipping requests'
+    text decoding step; anything without a bytes body uses response.json().
+    """
+    if orjson is not None:
+        content = getattr(response, "content", None)
+        if isinstance(content, bytes):
+            return orjson.loads(content)
+    return response.json()
+
+
+def _new_registry_session() -> "requests.Session":
+    """Create a Schema Registry session with a keep-alive pool and retries."""
+    # Imported here so validators without a registry never load requests
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_REGISTRY_POOL_CONNECTIONS,
+        pool_maxsize=_REGISTRY_POOL_MAXSIZE,
+        max_retries=Retry(total=_REGISTRY_MAX_RETRIES, backoff_factor=0.1)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _get_shared_session(url: str) -> "requests.Session":
+    """
+    Get the pooled session shared by every client of a Schema Registry.
+
+    Clients for the same registry reuse its keep-alive connections instead
+    of opening (and TLS-handshaking) their own. At most
+    _SHARED_SESSION_CACHE_SIZE registries keep a shared session; clients
+    already holding an evicted session keep using it.
+
+    Args:
+        url: Schema Registry base URL, without a trailing slash
+
+    Returns:
+        Session for that registry
+    """
+    with _shared_sessions_lock:
+        session = _shared_sessions.get(url)
+        if session is not None:
+            _shared_sessions.move_to_end(url)
+            return session
+
+        session = _new_registry_session()
+        _shared_sessions[url] = session
+        if len(_shared_sessions) > _SHARED_SESSION_CACHE_SIZE:
+            _shared_sessions.popitem(last=False)
+        return session
+
+
+def close_shared_sessions() -> None:
+    """
+    Close and drop every shared Schema Registry session.
+
+    Clients created afterwards get a fresh session. Clients still holding a
+    closed session reopen its connections on their next request.
+    """
+    with _shared_sessions_lock:
+        sessions = list(_shared_sessions.values())
+        _shared_sessions.clear()
+
+    for session in sessions:
+        session.close()
+
+
+class SimpleSchemaRegistryClient:
+    """Simple HTTP client for Schema Registry."""
+
+    # Reads are cached here, so SchemaValidator does not cache them again
+    caches_reads = True
+
+    __slots__ = (
+        "url", "session", "_id_cache", "_subject_cache", "_version_cache", "_parsed_id_cache",
+        "_subjects_list_cache", "_config_cache"
+    )
+
+    def __init__(
+        self,
+        url: str,
+        session: Optional["requests.Session"] = None,
+        cache_ttl: Optional[float] = None
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            url: Schema Registry base URL
+            session: Session to send requests with; defaults to the pooled
+                     session shared by all clients of the same URL. Any
+                     object with a headers mapping and requests-style
+                     get/post/put/delete methods returning requests-like
+                     responses works; requests is then never imported.
+            cache_ttl: Upper bound in seconds on how long any response is
+                       cached (0 disables caching); by default schema IDs
+                       and numbered versions are kept for an hour and
+                       subject lookups for 30 seconds
+        """
+        self.url = url.rstrip('/')
+        self.session = session if session is not None else _get_shared_session(self.url)
+        self.session.headers.update({"Content-Type": "application/vnd.schemaregistry.v1+json"})
+
+        id_ttl = _ID_CACHE_TTL if cache_ttl is None else min(_ID_CACHE_TTL, cache_ttl)
+        subject_ttl = _SUBJECT_CACHE_TTL if cache_ttl is None else min(_SUBJECT_CACHE_TTL, cache_ttl)
+
+        # Schema IDs are immutable in the registry, so they can be kept long;
+        # subject lookups change whenever a version is registered or deleted
+        self._id_cache = TTLCache(maxsize=_REGISTRY_CACHE_SIZE, ttl=id_ttl)
+        self._subject_cache = TTLCache(maxsize=_SUBJECT_CACHE_SIZE, ttl=subject_ttl)
+
+        # A numbered subject version never changes once written; it can only
+        # be deleted, which drops it here too
+        self._version_cache = TTLCache(maxsize=_REGISTRY_CACHE_SIZE, ttl=id_ttl)
+
+        # Parsed schemas by ID, shared by every subject version bound to that
+        # ID. This only saves decoding: callers always get copies, so no
+        # caller can mutate the shared object.
+        self._parsed_id_cache = TTLCache(maxsize=_REGISTRY_CACHE_SIZE, ttl=id_ttl)
+
+        # The subject list and per-subject compatibility levels change with
+        # writes, like subject lookups
+        self._subjects_list_cache = TTLCache(maxsize=1, ttl=subject_ttl)
+        self._config_cache = TTLCache(maxsize=_SUBJECT_CACHE_SIZE, ttl=subject_ttl)
+
+    def get_schema_by_id(self, schema_id: int) -> Dict[str, Any]:
+        """Get schema by ID."""
+        return _copy_json(
+            self._id_cache.get_or_load(schema_id, lambda: self._fetch_schema_by_id(schema_id))
+        )
+
+    def _fetch_schema_by_id(self, schema_id: int) -> Dict[str, Any]:
+        """Fetch a schema by ID, bypassing the cache."""
+        response = self.session.get(f"{self.url}/schemas/ids/{schema_id}")
+        response.raise_for_status()
+        return _response_json(response)["schema"]
+
+    def get_latest_schema_version(self, subject: str) -> Tuple[int, Dict[str, Any]]:
+        """Get latest schema version for a subject."""
+        version, schema = self._subject_cache.get_or_load(
+            ("latest", subject), lambda: self._fetch_latest_schema_version(subject)
+        )
+        return version, _copy_json(schema)
+
+    def _fetch_latest_schema_version(self, subject: str) -> Tuple[int, Dict[str, Any]]:
+        """Fetch the latest version of a subject, bypassing the cache."""
+        response = self.session.get(f"{self.url}/subjects/{subject}/versions/latest")
+        response.raise_for_status()
+        data = _response_json(response)
+        return data["version"], self._parse_version_schema(data)
+
+    def get_all_versions(self, subject: str) -> List[Tuple[int, Dict[str, Any]]]:
+        """Get all versions for a subject."""
+        versions = self._subject_cache.get_or_load(
+            ("all", subject), lambda: self._fetch_all_versions(subject)
+        )
+        return [(version, _copy_json(schema)) for version, schema in versions]
+
+    def _fetch_all_versions(self, subject: str) -> List[Tuple[int, Dict[str, Any]]]:
+        """Fetch all versions of a subject, bypassing the cache."""
+        response = self.session.get(f"{self.url}/subjects/{subject}/versions")
+        response.raise_for_status()
+        versions = _response_json(response)
+
+        # Fetch the versions concurrently; map() keeps the registry's order
+        return list(_REGISTRY_EXECUTOR.map(
+            lambda version: (version, self._get_schema_by_version(subject, version)), versions
+        ))
+
+    def register_schema(self, subject: str, schema: Dict[str, Any]) -> int:
+        """Register a new schema."""
+        payload = {"schema": _dumps(schema)}
+        response = self.session.post(f"{self.url}/subjects/{subject}/versions", json=payload)
+        response.raise_for_status()
+        self._invalidate_subject(subject)
+        self._subjects_list_cache.clear()
+        return _response_json(response)["id"]
+
+    def test_compatibility(self, subject: str, schema: Dict[str, Any]) -> bool:
+        """Test if schema is compatible."""
+        payload = {"schema": _dumps(schema)}
+        response = self.session.post(f"{self.url}/compatibility/subjects/{subject}/versions/latest", json=payload)
+        response.raise_for_status()
+        return _response_json(response)["is_compatible"]
+
+    def get_schema_by_version(self, subject: str, version: int) -> Dict[str, Any]:
+        """Get schema by subject and version."""
+        return _copy_json(self._get_schema_by_version(subject, version))
+
+    def _get_schema_by_version(self, subject: str, version: int) -> Dict[str, Any]:
+        """Get the cached, shared schema for a subject version."""
+        return self._version_cache.get_or_load(
+            (subject, version), lambda: self._fetch_schema_by_version(subject, version)
+        )
+
+    def _fetch_schema_by_version(self, subject: str, version: int) -> Dict[str, Any]:
+        """Fetch a subject version's schema, bypassing the cache."""
+        response = self.session.get(f"{self.url}/subjects/{subject}/versions/{version}")
+        response.raise_for_status()
+        return self._parse_version_schema(_response_json(response))
+
+    def list_subjects(self) -> List[str]:
+        """List all subjects."""
+        return list(self._subjects_list_cache.get_or_load(None, self._fetch_subjects))
+
+    def _fetch_subjects(self) -> List[str]:
+        """Fetch the subject list, bypassing the cache."""
+        response = self.session.get(f"{self.url}/subjects")
+        response.raise_for_status()
+        return _response_json(response)
+
+    def delete_schema_version(self, subject: str, version: int) -> bool:
+        """Delete a schema version."""
+        response = self.session.delete(f"{self.url}/subjects/{subject}/versions/{version}")
+        response.raise_for_status()
+        self._invalidate_subject(subject)
+        self._version_cache.invalidate(lambda key: key == (subject, version))
+        self._subjects_list_cache.clear()
+        return True
+
+    def get_compatibility(self, subject: str) -> str:
+        """Get compatibility mode for subject."""
+        return self._config_cache.get_or_load(subject, lambda: self._fetch_compatibility(subject))
+
+    def _fetch_compatibility(self, subject: str) -> str:
+        """Fetch a subject's compatibility level, bypassing the cache."""
+        response = self.session.get(f"{self.url}/config/{subject}")
+        response.raise_for_status()
+        return _response_json(response)["compatibilityLevel"]
+
+    def set_compatibility(self, subject: str, level: str) -> bool:
+        """Set compatibility mode for subject."""
+        payload = {"compatibility": level}
+        response = self.session.put(f"{self.url}/config/{subject}", json=payload)
+        response.raise_for_status()
+        self._config_cache.invalidate(lambda key: key == subject)
+        return True
+
+    def _parse_version_schema(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse the schema in a subject-version response.
+
+        Versions carrying a schema ID reuse the schema already parsed for
+        that ID, so its JSON is decoded once for every subject it is
+        registered under. The public getters hand out a fresh copy per call.
+        """
+        schema_id = data.get("id")
+        if schema_id is None:
+            return _loads(data["schema"])
+        return self._parsed_id_cache.get_or_load(schema_id, lambda: _loads(data["schema"]))
+
+    def _invalidate_subject(self, subject: str) -> None:
+        """Drop cached version lookups for a subject after a write."""
+        self._subject_cache.invalidate(lambda key: key[1] == subject)
+
+    def clear_cache(self) -> None:
+        """Drop every cached registry response."""
+        self._id_cache.clear()
+        self._subject_cache.clear()
+        self._version_cache.clear()
+        self._parsed_id_cache.clear()
+        self._subjects_list_cache.clear()
+        self._config_cache.clear()
+
+
 class SchemaValidator:
     """
     Validator for CDC pipeline schemas.
@@ -52,11 +806,20 @@ class SchemaValidator:
     between schema versions.
     """
 
+    # Direction checks run for each mode, in order, looked up by name so
+    # that subclasses can override them
+    _MODE_CHECKS = {
+        CompatibilityMode.BACKWARD: ("_check_backward",),
+        CompatibilityMode.FORWARD: ("_check_forward",),
+        CompatibilityMode.FULL: ("_check_backward", "_check_forward"),
+    }
+
     def __init__(
         self,
         compatibility_mode: CompatibilityMode = CompatibilityMode.BACKWARD,
         schema_registry_url: Optional[str] = None,
-        strict_mode: bool = False
+        strict_mode: bool = False,
+        registry_cache_ttl: float = 60.0
     ):
         """
         Initialize schema validator.
@@ -65,105 +828,44 @@ class SchemaValidator:
             compatibility_mode: Schema compatibility mode to enforce
             schema_registry_url: URL of Schema Registry (e.g., http://localhost:8081)
             strict_mode: If True, treat warnings as errors
+            registry_cache_ttl: Seconds to cache Schema Registry reads (0 disables);
+                                also bounds the caches of the built-in registry client
         """
         self.compatibility_mode = compatibility_mode
         self.schema_registry_url = schema_registry_url
-        self.schema_registry_client = None
+        self.schema_registry_client: Optional[SchemaRegistryClientProtocol] = None
         self.strict_mode = strict_mode
 
+        # Guards the compatibility result cache; held only for lookups and
+        # stores, never while a result is computed
+        self._schema_cache_lock = threading.Lock()
+
+        # Compatibility results keyed by (new fingerprint, old fingerprint, mode),
+        # stored as (compatible, violation); a fresh exception is raised per hit.
+        # Fingerprints are hashed from each schema's current content, so a
+        # schema edited in place gets a new key instead of a stale result.
+        self._compat_cache: "OrderedDict[Tuple[str, str, Any], Tuple[bool, Optional[_Violation]]]" = OrderedDict()
+
+        # Idempotent Schema Registry reads keyed by (client method, *args),
+        # for clients that do not cache reads themselves, and registered
+        # schema IDs keyed by ("register_schema", subject, fingerprint)
+        self.registry_cache_ttl = registry_cache_ttl
+        self._registry_cache = TTLCache(maxsize=_REGISTRY_CACHE_SIZE, ttl=registry_cache_ttl)
+
         if schema_registry_url:
             self._init_schema_registry_client()
 
         logger.info(
-            f"Initialized SchemaValidator with {compatibility_mode.value} compatibility "
-            f"(strict_mode={strict_mode})"
+            "Initialized SchemaValidator with %s compatibility (strict_mode=%s)",
+            compatibility_mode.value, strict_mode
         )
 
     def _init_schema_registry_client(self):
         """Initialize Schema Registry HTTP client."""
-        class SimpleSchemaRegistryClient:
-            """Simple HTTP client for Schema Registry."""
-
-            def __init__(self, url: str):
-                self.url = url.rstrip('/')
-                self.session = requests.Session()
-                self.session.headers.update({"Content-Type": "application/vnd.schemaregistry.v1+json"})
-
-            def get_schema_by_id(self, schema_id: int) -> Dict[str, Any]:
-                """Get schema by ID."""
-                response = self.session.get(f"{self.url}/schemas/ids/{schema_id}")
-                response.raise_for_status()
-                return response.json()["schema"]
-
-            def get_latest_schema_version(self, subject: str) -> Tuple[int, Dict[str, Any]]:
-                """Get latest schema version for a subject."""
-                response = self.session.get(f"{self.url}/subjects/{subject}/versions/latest")
-                response.raise_for_status()
-                data = response.json()
-                return data["version"], json.loads(data["schema"])
-
-            def get_all_versions(self, subject: str) -> List[Tuple[int, Dict[str, Any]]]:
-                """Get all versions for a subject."""
-                response = self.session.get(f"{self.url}/subjects/{subject}/versions")
-                response.raise_for_status()
-                versions = response.json()
-
-                results = []
-                for version in versions:
-                    resp = self.session.get(f"{self.url}/subjects/{subject}/versions/{version}")
-                    resp.raise_for_status()
-                    data = resp.json()
-                    results.append((data["version"], json.loads(data["schema"])))
-
-                return results
-
-            def register_schema(self, subject: str, schema: Dict[str, Any]) -> int:
-                """Register a new schema."""
-                payload = {"schema": json.dumps(schema)}
-                response = self.session.post(f"{self.url}/subjects/{subject}/versions", json=payload)
-                response.raise_for_status()
-                return response.json()["id"]
-
-            def test_compatibility(self, subject: str, schema: Dict[str, Any]) -> bool:
-                """Test if schema is compatible."""
-                payload = {"schema": json.dumps(schema)}
-                response = self.session.post(f"{self.url}/compatibility/subjects/{subject}/versions/latest", json=payload)
-                response.raise_for_status()
-                return response.json()["is_compatible"]
-
-            def get_schema_by_version(self, subject: str, version: int) -> Dict[str, Any]:
-                """Get schema by subject and version."""
-                response = self.session.get(f"{self.url}/subjects/{subject}/versions/{version}")
-                response.raise_for_status()
-                return json.loads(response.json()["schema"])
-
-            def list_subjects(self) -> List[str]:
-                """List all subjects."""
-                response = self.session.get(f"{self.url}/subjects")
-                response.raise_for_status()
-                return response.json()
-
-            def delete_schema_version(self, subject: str, version: int) -> bool:
-                """Delete a schema version."""
-                response = self.session.delete(f"{self.url}/subjects/{subject}/versions/{version}")
-                response.raise_for_status()
-                return True
-
-            def get_compatibility(self, subject: str) -> str:
-                """Get compatibility mode for subject."""
-                response = self.session.get(f"{self.url}/config/{subject}")
-                response.raise_for_status()
-                return response.json()["compatibilityLevel"]
-
-            def set_compatibility(self, subject: str, level: str) -> bool:
-                """Set compatibility mode for subject."""
-                payload = {"compatibility": level}
-                response = self.session.put(f"{self.url}/config/{subject}", json=payload)
-                response.raise_for_status()
-                return True
-
-        self.schema_registry_client = SimpleSchemaRegistryClient(self.schema_registry_url)
-        logger.info(f"Initialized Schema Registry client for {self.schema_registry_url}")
+        self.schema_registry_client = SimpleSchemaRegistryClient(
+            self.schema_registry_url, cache_ttl=self.registry_cache_ttl
+        )
+        logger.info("Initialized Schema Registry client for %s", self.schema_registry_url)
 
     def validate_avro_schema(self, schema: Dict[str, Any], warn_missing_namespace: bool = True) -> bool:
         """
@@ -182,66 +884,44 @@ class SchemaValidator:
         if not isinstance(schema, dict):
             raise SchemaValidationError("Schema must be a dictionary")
 
-        # Check required fields
-        required_fields = ["type", "name"]
-        missing_fields = [field for field in required_fields if field not in schema]
+        # Read each top-level key once; the checks below only touch locals.
+        # A key set to None is present, so only the sentinel means missing.
+        schema_type = schema.get("type", _MISSING)
+        schema_name = schema.get("name", _MISSING)
 
-        if missing_fields:
-            raise SchemaValidationError(f"Schema missing required fields: {missing_fields}")
+        # Check required fields
+        if schema_type is _MISSING or schema_name is _MISSING:
+            missing_fields = [
+                key for key, value in (("type", schema_type), ("name", schema_name))
+                if value is _MISSING
+            ]
+            raise SchemaValidationError("Schema missing required fields: {}", missing_fields)
 
         # Check for missing namespace (Bug #6 fix)
-        if warn_missing_namespace and "namespace" not in schema:
-            warning_msg = (
-                f"Schema '{schema.get('name')}' missing 'namespace' field. "
-                f"Namespaces prevent naming conflicts and are strongly recommended. "
-                f"Example: 'namespace': 'com.example.cdc'"
-            )
-
+        if warn_missing_namespace and schema.get("namespace", _MISSING) is _MISSING:
             if self.strict_mode:
-                raise SchemaValidationError(warning_msg)
-            else:
-                logger.warning(warning_msg)
+                raise SchemaValidationError(_MISSING_NAMESPACE_MESSAGE, schema_name)
+            elif logger.isEnabledFor(logging.WARNING):
+                logger.warning(_MISSING_NAMESPACE_MESSAGE.format(schema_name))
 
-        # Validate type
-        valid_types = ["record", "enum", "array", "map", "fixed"]
-        schema_type = schema.get("type")
+        # Validate type (named types by name, or an inline type definition)
+        if isinstance(schema_type, str):
+            valid_type = schema_type in _VALID_TYPE_NAMES
+        else:
+            valid_type = isinstance(schema_type, dict)
 
-        if schema_type not in valid_types and not isinstance(schema_type, dict):
-            raise SchemaValidationError(f"Invalid schema type: {schema_type}")
+        if not valid_type:
+            raise SchemaValidationError("Invalid schema type: {}", schema_type)
 
-        # Validate fields if it's a record type
+        # Apply the type-specific rules on every call: the walk is linear in
+        # the number of fields, and an identity memo would keep passing a
+        # schema that was mutated in place after it was validated
         if schema_type == "record":
-            if "fields" not in schema:
-                raise SchemaValidationError("Record schema must have 'fields' property")
-
-            if not isinstance(schema["fields"], list):
-                raise SchemaValidationError("Schema 'fields' must be a list")
+            _validate_record(schema)
 
-            for field in schema["fields"]:
-                self._validate_field(field)
-
-        logger.debug(f"Schema validation passed for: {schema.get('name')}")
+        logger.debug("Schema validation passed for: %s", schema_name)
         return True
 
-    def _validate_field(self, field: Dict[str, Any]) -> None:
-        """
-        Validate a single Avro field.
-
-        Args:
-            field: Field dictionary
-
-        Raises:
-            SchemaValidationError: If field is invalid
-        """
-        if not isinstance(field, dict):
-            raise SchemaValidationError("Field must be a dictionary")
-
-        if "name" not in field:
-            raise SchemaValidationError("Field must have a 'name' property")
-
-        if "type" not in field:
-            raise SchemaValidationError(f"Field '{field['name']}' must have a 'type' property")
-
     def check_backward_compatibility(
         self,
         new_schema: Dict[str, Any],
@@ -262,50 +942,11 @@ class SchemaValidator:
         Raises:
             SchemaCompatibilityError: If schemas are incompatible
         """
-        logger.debug("Checking backward compatibility")
+        return self.check_compatibility(new_schema, old_schema, CompatibilityMode.BACKWARD)
 
-        # Validate both schemas first
-        self.validate_avro_schema(new_schema)
-        self.validate_avro_schema(old_schema)
-
-        # Check if it's the same schema type
-        if new_schema.get("type") != old_schema.get("type"):
-            raise SchemaCompatibilityError(
-                f"Schema type changed from {old_schema.get('type')} to {new_schema.get('type')}"
-            )
-
-        # For record types, check field compatibility
-        if new_schema.get("type") == "record":
-            old_fields = {f["name"]: f for f in old_schema.get("fields", [])}
-            new_fields = {f["name"]: f for f in new_schema.get("fields", [])}
-
-            # Check that no fields were removed from old schema
-            for field_name in old_fields:
-                if field_name not in new_fields:
-                    raise SchemaCompatibilityError(
-                        f"Field '{field_name}' removed without default value"
-                    )
-
-            # Check that new fields have defaults
-            for field_name, new_field in new_fields.items():
-                if field_name not in old_fields and "default" not in new_field:
-                    raise SchemaCompatibilityError(
-                        f"New field '{field_name}' added without default value"
-                    )
-
-            # Check that fields in both schemas have compatible types
-            for field_name in set(old_fields.keys()) & set(new_fields.keys()):
-                old_field = old_fields[field_name]
-                new_field = new_fields[field_name]
-
-                # Check if field type changed
-                if not self._is_type_compatible(new_field["type"], old_field["type"]):
-                    raise SchemaCompatibilityError(
-                        f"Field '{field_name}' type changed incompatibly"
-                    )
-
-        logger.info("Backward compatibility check passed")
-        return True
+    def _check_backward(self, new: CanonicalSchema, old: CanonicalSchema) -> Optional[_Violation]:
+        """Return why new cannot read data written with old, or None."""
+        return _backward_violation(new, old)
 
     def check_forward_compatibility(
         self,
@@ -327,44 +968,11 @@ class SchemaValidator:
         Raises:
             SchemaCompatibilityError: If schemas are incompatible
         """
-        logger.debug("Checking forward compatibility")
+        return self.check_compatibility(new_schema, old_schema, CompatibilityMode.FORWARD)
 
-        # Validate both schemas first
-        self.validate_avro_schema(new_schema)
-        self.validate_avro_schema(old_schema)
-
-        # Check if it's the same schema type
-        if new_schema.get("type") != old_schema.get("type"):
-            raise SchemaCompatibilityError(
-                f"Schema type changed from {old_schema.get('type')} to {new_schema.get('type')}"
-            )
-
-        # For record types, check field compatibility
-        if new_schema.get("type") == "record":
-            old_fields = {f["name"]: f for f in old_schema.get("fields", [])}
-            new_fields = {f["name"]: f for f in new_schema.get("fields", [])}
-
-            # Check that no fields were removed from old schema
-            # (old readers expect all their fields to be present or have defaults)
-            for field_name, old_field in old_fields.items():
-                if field_name not in new_fields:
-                    raise SchemaCompatibilityError(
-                        f"Field '{field_name}' removed in new schema"
-                    )
-
-            # Check that fields in both schemas have compatible types
-            for field_name in set(old_fields.keys()) & set(new_fields.keys()):
-                old_field = old_fields[field_name]
-                new_field = new_fields[field_name]
-
-                # Check if field type changed
-                if not self._is_type_compatible(new_field["type"], old_field["type"]):
-                    raise SchemaCompatibilityError(
-                        f"Field '{field_name}' type changed incompatibly"
-                    )
-
-        logger.info("Forward compatibility check passed")
-        return True
+    def _check_forward(self, new: CanonicalSchema, old: CanonicalSchema) -> Optional[_Violation]:
+        """Return why old cannot read data written with new, or None."""
+        return _forward_violation(new, old)
 
     def check_full_compatibility(
         self,
@@ -384,13 +992,8 @@ class SchemaValidator:
         Raises:
             SchemaCompatibilityError: If schemas are incompatible
         """
-        logger.debug("Checking full compatibility")
-
-        self.check_backward_compatibility(new_schema, old_schema)
-        self.check_forward_compatibility(new_schema, old_schema)
-
-        logger.info("Full compatibility check passed")
-        return True
+        # Both directions share one validation and one set of canonical views
+        return self.check_compatibility(new_schema, old_schema, CompatibilityMode.FULL)
 
     def check_compatibility(
         self,
@@ -411,20 +1014,161 @@ class SchemaValidator:
 
         Raises:
             SchemaCompatibilityError: If schemas are incompatible
+            ValueError: If the mode is unknown
         """
         mode = mode or self.compatibility_mode
 
-        if mode == CompatibilityMode.BACKWARD:
-            return self.check_backward_compatibility(new_schema, old_schema)
-        elif mode == CompatibilityMode.FORWARD:
-            return self.check_forward_compatibility(new_schema, old_schema)
-        elif mode == CompatibilityMode.FULL:
-            return self.check_full_compatibility(new_schema, old_schema)
-        elif mode == CompatibilityMode.NONE:
+        checks = self._mode_checks(mode)
+        if checks is None:
             logger.info("Compatibility checking disabled")
             return True
-        else:
+
+        direction = mode.value.lower()
+        logger.debug("Checking %s compatibility", direction)
+
+        self.validate_avro_schema(new_schema)
+        self._run_compat_checks(mode, new_schema, old_schema, *checks)
+
+        logger.info("%s compatibility check passed", direction.capitalize())
+        return True
+
+    def is_compatible(
+        self,
+        new_schema: Dict[str, Any],
+        old_schema: Dict[str, Any],
+        mode: Optional[CompatibilityMode] = None
+    ) -> bool:
+        """
+        Check schema compatibility without raising for incompatible schemas.
+
+        Args:
+            new_schema: New schema version
+            old_schema: Previous schema version
+            mode: Compatibility mode (uses instance default if not provided)
+
+        Returns:
+            True if schemas are compatible, False otherwise
+
+        Raises:
+            SchemaValidationError: If either schema is invalid
+            ValueError: If the mode is unknown
+        """
+        mode = mode or self.compatibility_mode
+
+        checks = self._mode_checks(mode)
+        if checks is None:
+            return True
+
+        self.validate_avro_schema(new_schema)
+        return self._find_violation(mode, new_schema, old_schema, *checks) is None
+
+    def _mode_checks(
+        self,
+        mode: CompatibilityMode
+    ) -> Optional[List[Callable[[CanonicalSchema, CanonicalSchema], Optional[_Violation]]]]:
+        """
+        Look up the direction checks a compatibility mode runs.
+
+        Returns:
+            The bound checks, in order, or None for CompatibilityMode.NONE
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        check_names = self._MODE_CHECKS.get(mode)
+        if check_names is None:
+            if mode == CompatibilityMode.NONE:
+                return None
             raise ValueError(f"Unknown compatibility mode: {mode}")
+        return [getattr(self, name) for name in check_names]
+
+    def _run_compat_checks(
+        self,
+        mode: CompatibilityMode,
+        new_schema: Dict[str, Any],
+        old_schema: Dict[str, Any],
+        *checks: Callable[[CanonicalSchema, CanonicalSchema], Optional[_Violation]]
+    ) -> None:
+        """
+        Run direction checks, raising SchemaCompatibilityError on the first violation.
+
+        See _find_violation for arguments.
+
+        Raises:
+            SchemaValidationError: If the old schema is invalid
+            SchemaCompatibilityError: If schemas are incompatible
+        """
+        violation = self._find_violation(mode, new_schema, old_schema, *checks)
+        if violation is not None:
+            raise _incompatible(*violation)
+
+    def _find_violation(
+        self,
+        mode: CompatibilityMode,
+        new_schema: Dict[str, Any],
+        old_schema: Dict[str, Any],
+        *checks: Callable[[CanonicalSchema, CanonicalSchema], Optional[_Violation]]
+    ) -> Optional[_Violation]:
+        """
+        Run direction checks of an already validated new schema against an old one.
+
+        Identical schemas, whether the same object or equal in content, need
+        no checks. Otherwise results are memoized by (new fingerprint, old
+        fingerprint, mode).
+
+        Args:
+            mode: Compatibility mode the checks implement (part of the cache key)
+            new_schema: New schema version, already validated
+            old_schema: Previous schema version
+            *checks: Direction checks to run against the canonical views
+
+        Returns:
+            The first (reason, *args) violation, or None if compatible
+
+        Raises:
+            SchemaValidationError: If the old schema is invalid
+        """
+        if new_schema is old_schema:
+            return None
+
+        # Internal comparisons hash documentation too: that skips the stripped
+        # copy, and a doc-only difference merely falls through to the checks
+        new_fp = self.get_schema_fingerprint(new_schema, include_meta=True)
+        old_fp = self.get_schema_fingerprint(old_schema, include_meta=True)
+        if new_fp == old_fp:
+            return None
+
+        key = (new_fp, old_fp, mode)
+        with self._schema_cache_lock:
+            cached = self._compat_cache.get(key)
+            if cached is not None:
+                self._compat_cache.move_to_end(key)
+        if cached is not None:
+            return cached[1]
+
+        self.validate_avro_schema(old_schema)
+        new = self._canonicalize(new_schema, new_fp)
+        old = self._canonicalize(old_schema, old_fp)
+
+        violation = None
+        for check in checks:
+            violation = check(new, old)
+            if violation is not None:
+                break
+
+        self._cache_compat_result(key, (violation is None, violation))
+        return violation
+
+    def _cache_compat_result(
+        self,
+        key: Tuple[str, str, Any],
+        result: Tuple[bool, Optional[_Violation]]
+    ) -> None:
+        """Store a compatibility result, evicting the least recently used entry."""
+        with self._schema_cache_lock:
+            self._compat_cache[key] = result
+            if len(self._compat_cache) > _COMPAT_CACHE_SIZE:
+                self._compat_cache.popitem(last=False)
 
     def _is_type_compatible(self, new_type: Any, old_type: Any) -> bool:
         """
@@ -437,38 +1181,44 @@ class SchemaValidator:
         Returns:
             True if types are compatible
         """
-        # Exact match
-        if new_type == old_type:
-            return True
+        return _types_compatible(new_type, old_type)
 
-        # Handle union types
-        if isinstance(new_type, list) and isinstance(old_type, list):
-            # New union must contain all old types
-            return all(ot in new_type for ot in old_type)
-
-        # Handle nullable types (union with null)
-        if isinstance(new_type, list) and "null" in new_type:
-            non_null_types = [t for t in new_type if t != "null"]
-            if len(non_null_types) == 1:
-                return self._is_type_compatible(non_null_types[0], old_type)
-
-        if isinstance(old_type, list) and "null" in old_type:
-            non_null_types = [t for t in old_type if t != "null"]
-            if len(non_null_types) == 1:
-                return self._is_type_compatible(new_type, non_null_types[0])
-
-        # Type promotions (e.g., int -> long)
-        type_promotions = {
-            "int": ["long", "float", "double"],
-            "long": ["float", "double"],
-            "float": ["double"],
-            "string": ["bytes"]
-        }
+    def clear_schema_caches(self) -> None:
+        """Forget all memoized compatibility results."""
+        with self._schema_cache_lock:
+            self._compat_cache.clear()
+
+    def _canonicalize(self, schema: Dict[str, Any], fingerprint: Optional[str] = None) -> CanonicalSchema:
+        """
+        Build the canonical view of a schema.
 
-        if old_type in type_promotions:
-            return new_type in type_promotions[old_type]
+        The view is built from the schema's current content on every call;
+        indexing the fields is linear in their number.
 
-        return False
+        Args:
+            schema: Schema dictionary
+            fingerprint: The schema's fingerprint with documentation included,
+                         if already computed
+
+        Returns:
+            CanonicalSchema for the schema
+        """
+        if fingerprint is None:
+            fingerprint = self.get_schema_fingerprint(schema, include_meta=True)
+
+        schema_type = schema.get("type")
+        if schema_type == "record":
+            fields_by_name = MappingProxyType(_index_fields(schema))
+        else:
+            fields_by_name = _NO_FIELDS
+
+        return CanonicalSchema(
+            schema_type=schema_type,
+            name=schema.get("name"),
+            namespace=schema.get("namespace"),
+            fields_by_name=fields_by_name,
+            fingerprint=fingerprint
+        )
 
     def parse_schema(self, schema_str: str) -> Dict[str, Any]:
         """
@@ -484,29 +1234,58 @@ class SchemaValidator:
             SchemaValidationError: If parsing fails
         """
         try:
-            schema = json.loads(schema_str)
+            schema = _loads(schema_str)
             return schema
         except json.JSONDecodeError as e:
-            raise SchemaValidationError(f"Failed to parse schema: {e}")
+            raise SchemaValidationError("Failed to parse schema: {}", e)
 
-    def get_schema_fingerprint(self, schema: Dict[str, Any]) -> str:
+    def get_schema_fingerprint(self, schema: Dict[str, Any], include_meta: bool = False) -> str:
         """
         Generate a fingerprint for the schema.
 
+        Documentation attributes (doc, aliases, description) are ignored by
+        default, so schemas differing only in documentation share a
+        fingerprint. The fingerprint is always computed from the schema's
+        current content.
+
         Args:
             schema: Schema dictionary
+            include_meta: If True, hash documentation attributes too
 
         Returns:
-            Schema fingerprint (canonical JSON string)
+            Schema fingerprint (64-character BLAKE2b-256 hex digest of the
+            canonical JSON form)
         """
-        import hashlib
-
-        canonical = json.dumps(schema, sort_keys=True, separators=(',', ':'))
-        fingerprint = hashlib.sha256(canonical.encode()).hexdigest()
+        # Hash the schema's current content on every call: an identity memo
+        # would keep returning the old fingerprint after an in-place edit
+        fingerprint = self._hash_schema(schema if include_meta else _strip_meta(schema))
 
-        logger.debug(f"Generated schema fingerprint: {fingerprint}")
+        logger.debug("Generated schema fingerprint: %s", fingerprint)
         return fingerprint
 
+    @staticmethod
+    def _hash_schema(schema: Any) -> str:
+        """Hash the canonical JSON form of a schema."""
+        # Hash the whole canonical buffer in a single update call
+        hasher = _HASH_PROTOTYPE.copy()
+        hasher.update(_canonical_json(schema))
+        return hasher.hexdigest()
+
+    def get_schema_fingerprints(self, schemas: List[Dict[str, Any]]) -> List[str]:
+        """
+        Generate fingerprints for many schemas in one pass.
+
+        Useful with bulk registry reads such as get_all_schema_versions.
+
+        Args:
+            schemas: Schema dictionaries
+
+        Returns:
+            Fingerprints in the same order as the input schemas
+        """
+        fingerprint = self.get_schema_fingerprint
+        return [fingerprint(schema) for schema in schemas]
+
     # ============================================================================
     # Schema Registry Integration Methods
     # ============================================================================
@@ -516,6 +1295,58 @@ class SchemaValidator:
         if not self.schema_registry_client:
             raise SchemaRegistryError("Schema Registry client not configured")
 
+    def _registry_call(self, error_message: str, method_name: str, *args: Any) -> Any:
+        """
+        Invoke a Schema Registry client method, wrapping any failure.
+
+        Args:
+            error_message: Message template for the failure, formatted with
+                           args only when the call fails
+            method_name: Name of the client method to call
+            *args: Arguments passed to the client method
+
+        Returns:
+            Whatever the client method returns
+
+        Raises:
+            SchemaRegistryError: If the client is not configured or the call fails
+        """
+        self._ensure_registry_client()
+
+        try:
+            return getattr(self.schema_registry_client, method_name)(*args)
+        except Exception as e:
+            raise SchemaRegistryError(f"{error_message.format(*args)}: {e}") from e
+
+    def _cached_registry_call(self, error_message: str, method_name: str, *args: Any) -> Any:
+        """
+        Like _registry_call, but serve repeated reads from the registry cache.
+
+        Clients that set caches_reads, such as SimpleSchemaRegistryClient,
+        are called directly so each read is cached in one layer only.
+        Failures are not cached. Each caller gets its own copy of the cached
+        value, so mutating a result cannot change what later calls return.
+        """
+        if getattr(self.schema_registry_client, "caches_reads", False):
+            return self._registry_call(error_message, method_name, *args)
+
+        return _copy_json(self._registry_cache.get_or_load(
+            (method_name,) + args,
+            lambda: self._registry_call(error_message, method_name, *args)
+        ))
+
+    def _invalidate_registry_cache(self, *method_names: str, subject: Optional[str] = None) -> None:
+        """
+        Drop cached registry reads made stale by a write.
+
+        Args:
+            *method_names: Client methods whose cached results to drop
+            subject: If given, only drop entries for this subject
+        """
+        self._registry_cache.invalidate(
+            lambda key: key[0] in method_names and (subject is None or key[1:2] == (subject,))
+        )
+
     def get_schema_by_id(self, schema_id: int) -> Dict[str, Any]:
         """
         Get schema from registry by ID.
@@ -529,19 +1360,18 @@ class SchemaValidator:
         Raises:
             SchemaRegistryError: If schema not found or registry error
         """
-        self._ensure_registry_client()
-
-        try:
-            schema = self.schema_registry_client.get_schema_by_id(schema_id)
-            logger.info(f"Retrieved schema {schema_id} from registry")
-            return schema
-        except Exception as e:
-            raise SchemaRegistryError(f"Failed to get schema {schema_id}: {e}")
+        schema = self._cached_registry_call("Failed to get schema {}", "get_schema_by_id", schema_id)
+        logger.info("Retrieved schema %s from registry", schema_id)
+        return schema
 
     def get_latest_schema_version(self, subject: str) -> Tuple[int, Dict[str, Any]]:
         """
         Get latest schema version for a subject.
 
+        Not cached here: the latest version changes with every registration,
+        and the built-in client already caches it briefly, so a second layer
+        would only stack the two TTLs.
+
         Args:
             subject: Subject name (e.g., "topic-value")
 
@@ -551,14 +1381,11 @@ class SchemaValidator:
         Raises:
             SchemaRegistryError: If subject not found or registry error
         """
-        self._ensure_registry_client()
-
-        try:
-            version, schema = self.schema_registry_client.get_latest_schema_version(subject)
-            logger.info(f"Retrieved latest schema for {subject}: version {version}")
-            return version, schema
-        except Exception as e:
-            raise SchemaRegistryError(f"Failed to get latest schema for {subject}: {e}")
+        version, schema = self._registry_call(
+            "Failed to get latest schema for {}", "get_latest_schema_version", subject
+        )
+        logger.info("Retrieved latest schema for %s: version %s", subject, version)
+        return version, schema
 
     def get_all_schema_versions(self, subject: str) -> List[Tuple[int, Dict[str, Any]]]:
         """
@@ -573,19 +1400,19 @@ class SchemaValidator:
         Raises:
             SchemaRegistryError: If subject not found or registry error
         """
-        self._ensure_registry_client()
-
-        try:
-            versions = self.schema_registry_client.get_all_versions(subject)
-            logger.info(f"Retrieved {len(versions)} version(s) for {subject}")
-            return versions
-        except Exception as e:
-            raise SchemaRegistryError(f"Failed to get versions for {subject}: {e}")
+        versions = self._registry_call("Failed to get versions for {}", "get_all_versions", subject)
+        logger.info("Retrieved %d version(s) for %s", len(versions), subject)
+        return versions
 
     def register_schema(self, subject: str, schema: Dict[str, Any]) -> int:
         """
         Register a new schema with the registry.
 
+        Registration is idempotent, so re-registering a schema already
+        registered under the subject returns the cached ID without calling
+        the registry. Documentation attributes count, since the registry
+        stores them.
+
         Args:
             subject: Subject name
             schema: Schema to register
@@ -596,14 +1423,55 @@ class SchemaValidator:
         Raises:
             SchemaRegistryError: If registration fails
         """
+        return self._register_schema(
+            subject, schema, self.get_schema_fingerprint(schema, include_meta=True)
+        )
+
+    def register_schemas(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[int]:
+        """
+        Register many schemas, overlapping the registry round-trips.
+
+        Args:
+            items: (subject, schema) pairs to register
+
+        Returns:
+            Schema IDs, in the order of items
+
+        Raises:
+            SchemaRegistryError: If any registration fails; the first failing
+                                 item in order is reported, and the others
+                                 are still attempted
+        """
         self._ensure_registry_client()
 
-        try:
-            schema_id = self.schema_registry_client.register_schema(subject, schema)
-            logger.info(f"Registered schema for {subject}: ID {schema_id}")
+        futures = [
+            _REGISTRY_EXECUTOR.submit(
+                self._register_schema, subject, schema,
+                self.get_schema_fingerprint(schema, include_meta=True)
+            )
+            for subject, schema in items
+        ]
+
+        # Let every registration finish before reporting a failure; map()
+        # would cancel the queued items after the first error
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def _register_schema(self, subject: str, schema: Dict[str, Any], fingerprint: str) -> int:
+        """Register a schema whose fingerprint (with meta) is already known."""
+        key = ("register_schema", subject, fingerprint)
+        schema_id = self._registry_cache.get(key)
+        if schema_id is not None:
+            logger.debug("Schema for %s already registered: ID %s", subject, schema_id)
             return schema_id
-        except Exception as e:
-            raise SchemaRegistryError(f"Failed to register schema for {subject}: {e}")
+
+        schema_id = self._registry_call(
+            "Failed to register schema for {}", "register_schema", subject, schema
+        )
+        self._invalidate_registry_cache("list_subjects")
+        self._registry_cache.set(key, schema_id)
+        logger.info("Registered schema for %s: ID %s", subject, schema_id)
+        return schema_id
 
     def test_compatibility_with_registry(self, subject: str, schema: Dict[str, Any]) -> bool:
         """
@@ -619,14 +1487,11 @@ class SchemaValidator:
         Raises:
             SchemaRegistryError: If registry error
         """
-        self._ensure_registry_client()
-
-        try:
-            is_compatible = self.schema_registry_client.test_compatibility(subject, schema)
-            logger.info(f"Compatibility test for {subject}: {is_compatible}")
-            return is_compatible
-        except Exception as e:
-            raise SchemaRegistryError(f"Failed to test compatibility for {subject}: {e}")
+        is_compatible = self._registry_call(
+            "Failed to test compatibility for {}", "test_compatibility", subject, schema
+        )
+        logger.info("Compatibility test for %s: %s", subject, is_compatible)
+        return is_compatible
 
     def get_schema_diff(self, subject: str, version1: int, version2: int) -> Dict[str, List[str]]:
         """
@@ -646,8 +1511,15 @@ class SchemaValidator:
         self._ensure_registry_client()
 
         try:
-            schema1 = self.schema_registry_client.get_schema_by_version(subject, version1)
-            schema2 = self.schema_registry_client.get_schema_by_version(subject, version2)
+            # Fetch both versions concurrently so the round-trips overlap
+            fetch = self.schema_registry_client.get_schema_by_version
+            if version1 == version2:
+                schema1 = schema2 = fetch(subject, version1)
+            else:
+                future1 = _REGISTRY_EXECUTOR.submit(fetch, subject, version1)
+                future2 = _REGISTRY_EXECUTOR.submit(fetch, subject, version2)
+                schema1 = future1.result()
+                schema2 = future2.result()
 
             # Calculate diff for record types
             diff = {
@@ -656,28 +1528,43 @@ class SchemaValidator:
                 "changed_fields": []
             }
 
-            if schema1.get("type") == "record" and schema2.get("type") == "record":
-                fields1 = {f["name"]: f for f in schema1.get("fields", [])}
-                fields2 = {f["name"]: f for f in schema2.get("fields", [])}
-
-                # Added fields
-                diff["added_fields"] = [name for name in fields2 if name not in fields1]
-
-                # Removed fields
-                diff["removed_fields"] = [name for name in fields1 if name not in fields2]
-
-                # Changed fields
-                for name in fields1:
-                    if name in fields2 and fields1[name]["type"] != fields2[name]["type"]:
-                        diff["changed_fields"].append(name)
-
-            logger.info(f"Schema diff for {subject} v{version1}->v{version2}: "
-                        f"{len(diff['added_fields'])} added, {len(diff['removed_fields'])} removed, "
-                        f"{len(diff['changed_fields'])} changed")
+            canonical1 = self._canonicalize(schema1)
+            canonical2 = self._canonicalize(schema2)
+
+            # Equal fingerprints mean no field differences to look for
+            if (
+                canonical1.fingerprint != canonical2.fingerprint
+                and canonical1.schema_type == "record"
+                and canonical2.schema_type == "record"
+            ):
+                fields1 = canonical1.fields_by_name
+                fields2 = canonical2.fields_by_name
+
+                # Removed and changed fields, in one pass over the old fields
+                removed = diff["removed_fields"]
+                changed = diff["changed_fields"]
+                for name, field1 in fields1.items():
+                    field2 = fields2.get(name)
+                    if field2 is None:
+                        removed.append(name)
+                    elif field1["type"] != field2["type"]:
+                        changed.append(name)
+
+                # Added fields. The new schema matched every kept old field,
+                # so it has added fields exactly when its count exceeds the
+                # kept fields; equal counts mean the field sets are the same
+                if len(fields2) > len(fields1) - len(removed):
+                    diff["added_fields"] = [name for name in fields2 if name not in fields1]
+
+            logger.info(
+                "Schema diff for %s v%s->v%s: %d added, %d removed, %d changed",
+                subject, version1, version2, len(diff["added_fields"]),
+                len(diff["removed_fields"]), len(diff["changed_fields"])
+            )
 
             return diff
         except Exception as e:
-            raise SchemaRegistryError(f"Failed to get schema diff: {e}")
+            raise SchemaRegistryError(f"Failed to get schema diff: {e}") from e
 
     def list_subjects(self) -> List[str]:
         """
@@ -689,14 +1576,9 @@ class SchemaValidator:
         Raises:
             SchemaRegistryError: If registry error
         """
-        self._ensure_registry_client()
-
-        try:
-            subjects = self.schema_registry_client.list_subjects()
-            logger.info(f"Found {len(subjects)} subject(s) in registry")
-            return subjects
-        except Exception as e:
-            raise SchemaRegistryError(f"Failed to list subjects: {e}")
+        subjects = self._cached_registry_call("Failed to list subjects", "list_subjects")
+        logger.info("Found %d subject(s) in registry", len(subjects))
+        return subjects
 
     def delete_schema_version(self, subject: str, version: int) -> bool:
         """
@@ -712,14 +1594,13 @@ class SchemaValidator:
         Raises:
             SchemaRegistryError: If deletion fails
         """
-        self._ensure_registry_client()
-
-        try:
-            result = self.schema_registry_client.delete_schema_version(subject, version)
-            logger.info(f"Deleted schema version {version} for {subject}")
-            return result
-        except Exception as e:
-            raise SchemaRegistryError(f"Failed to delete schema version: {e}")
+        result = self._registry_call(
+            "Failed to delete schema version", "delete_schema_version", subject, version
+        )
+        self._invalidate_registry_cache("register_schema", subject=subject)
+        self._invalidate_registry_cache("list_subjects")
+        logger.info("Deleted schema version %s for %s", version, subject)
+        return result
 
     def get_registry_compatibility_mode(self, subject: str) -> CompatibilityMode:
         """
@@ -734,15 +1615,17 @@ class SchemaValidator:
         Raises:
             SchemaRegistryError: If registry error
         """
-        self._ensure_registry_client()
+        mode_str = self._cached_registry_call("Failed to get compatibility mode", "get_compatibility", subject)
 
         try:
-            mode_str = self.schema_registry_client.get_compatibility(subject)
             mode = CompatibilityMode[mode_str]
-            logger.info(f"Compatibility mode for {subject}: {mode.value}")
-            return mode
-        except Exception as e:
-            raise SchemaRegistryError(f"Failed to get compatibility mode: {e}")
+        except KeyError as e:
+            raise SchemaRegistryError(
+                f"Failed to get compatibility mode: unknown level {mode_str!r}"
+            ) from e
+
+        logger.info("Compatibility mode for %s: %s", subject, mode.value)
+        return mode
 
     def set_registry_compatibility_mode(self, subject: str, mode: CompatibilityMode) -> bool:
         """
@@ -758,11 +1641,9 @@ class SchemaValidator:
         Raises:
             SchemaRegistryError: If registry error
         """
-        self._ensure_registry_client()
-
-        try:
-            result = self.schema_registry_client.set_compatibility(subject, mode.value)
-            logger.info(f"Set compatibility mode for {subject} to {mode.value}")
-            return result
-        except Exception as e:
-            raise SchemaRegistryError(f"Failed to set compatibility mode: {e}")
+        result = self._registry_call(
+            "Failed to set compatibility mode", "set_compatibility", subject, mode.value
+        )
+        self._invalidate_registry_cache("get_compatibility", subject=subject)
+        logger.info("Set compatibility mode for %s to %s", subject, mode.value)
+        return result
@@ -5,15 +5,115 @@ Provides a secure interface to HashiCorp Vault for retrieving secrets
 used by the CDC pipeline components.
 """
 
+import hashlib
 import os
-from typing import Dict, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass
 import hvac
 from hvac.exceptions import VaultError, InvalidPath
 import logging
 
+from src.utils.cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of authenticated hvac clients shared across VaultClient instances
+_CLIENT_CACHE_SIZE = 16
+
+# hvac clients keyed by (url, token SHA-256, verify); the token itself is not kept.
+# Each entry holds the client and the monotonic time its last successful
+# authentication check stops being trusted.
+_client_cache: "OrderedDict[Tuple[str, str, Any], Tuple[hvac.Client, float]]" = OrderedDict()
+_client_cache_lock = threading.Lock()
+
+# Seconds a successful authentication check is trusted; tokens live far longer
+_AUTH_CHECK_TTL = 5.0
+
+# Maximum number of secrets cached per VaultClient
+_SECRET_CACHE_SIZE = 128
+
+# Secret path holding each database's credentials
+_DATABASE_SECRET_PATHS: Mapping[str, str] = MappingProxyType({
+    "scylla": "scylla-credentials",
+    "postgres": "postgres-credentials",
+})
+
+
+def clear_client_cache() -> None:
+    """
+    Drop every shared hvac client.
+
+    VaultClient instances keep the clients they already hold; new instances
+    authenticate afresh.
+    """
+    with _client_cache_lock:
+        _client_cache.clear()
+
+
+def _client_cache_key(url: str, token: str, verify: Any) -> Tuple[str, str, Any]:
+    """Build the shared-client cache key, hashing the token so it is not kept."""
+    return (url, hashlib.sha256(token.encode()).hexdigest(), verify)
+
+
+def _evict_client(key: Tuple[str, str, Any], client: hvac.Client) -> None:
+    """Drop a shared client, unless the cache entry has since been replaced."""
+    with _client_cache_lock:
+        entry = _client_cache.get(key)
+        if entry is not None and entry[0] is client:
+            del _client_cache[key]
+
+
+def _get_authenticated_client(url: str, token: str, verify: Any) -> hvac.Client:
+    """
+    Get an authenticated hvac client, reusing one made for the same settings.
+
+    A reused client keeps its HTTP session, so its connections to Vault
+    stay open between VaultClient instances. Its token is re-checked before
+    reuse unless it was checked within the last _AUTH_CHECK_TTL seconds,
+    and a client that fails authentication is never shared.
+
+    Args:
+        url: Vault server URL
+        token: Vault authentication token
+        verify: SSL verification setting passed to hvac
+
+    Returns:
+        Authenticated hvac client
+
+    Raises:
+        VaultError: If authentication fails
+    """
+    key = _client_cache_key(url, token, verify)
+
+    with _client_cache_lock:
+        entry = _client_cache.get(key)
+        if entry is not None:
+            _client_cache.move_to_end(key)
+
+    now = time.monotonic()
+    if entry is not None and now < entry[1]:
+        return entry[0]
+
+    client = entry[0] if entry is not None else None
+    if client is None or not client.is_authenticated():
+        client = hvac.Client(url=url, token=token, verify=verify)
+        if not client.is_authenticated():
+            with _client_cache_lock:
+                _client_cache.pop(key, None)
+            raise VaultError("Failed to authenticate with Vault")
+
+    with _client_cache_lock:
+        _client_cache[key] = (client, now + _AUTH_CHECK_TTL)
+        _client_cache.move_to_end(key)
+        if len(_client_cache) > _CLIENT_CACHE_SIZE:
+            _client_cache.popitem(last=False)
+
+    return client
+
 
 @dataclass
 class HealthStatus:
@@ -50,7 +150,8 @@ class VaultClient:
         vault_url: Optional[str] = None,
         vault_token: Optional[str] = None,
         verify_ssl: bool = True,
-        mount_point: str = "secret"
+        mount_point: str = "secret",
+        secret_cache_ttl: float = 60.0
     ):
         """
         Initialize Vault client.
@@ -60,6 +161,7 @@ class VaultClient:
             vault_token: Vault authentication token (defaults to VAULT_TOKEN env var)
             verify_ssl: Whether to verify SSL certificates
             mount_point: KV secrets engine mount point
+            secret_cache_ttl: Seconds to cache secrets read from Vault (0 disables)
 
         Raises:
             ValueError: If required parameters are missing
@@ -68,6 +170,14 @@ class VaultClient:
         self.vault_url = vault_url or os.getenv("VAULT_ADDR")
         self.vault_token = vault_token or os.getenv("VAULT_TOKEN")
         self.mount_point = mount_point
+        self.verify_ssl = verify_ssl
+
+        # Monotonic time until which health checks trust the last successful
+        # authentication check; failures are never trusted
+        self._auth_ok_until = 0.0
+
+        # Secrets keyed by (mount point, path); failed reads are not cached
+        self._secret_cache = TTLCache(maxsize=_SECRET_CACHE_SIZE, ttl=secret_cache_ttl)
 
         if not self.vault_url:
             raise ValueError("Vault URL must be provided via parameter or VAULT_ADDR environment variable")
@@ -76,14 +186,7 @@ class VaultClient:
             raise ValueError("Vault token must be provided via parameter or VAULT_TOKEN environment variable")
 
         try:
-            self.client = hvac.Client(
-                url=self.vault_url,
-                token=self.vault_token,
-                verify=verify_ssl
-            )
-
-            if not self.client.is_authenticated():
-                raise VaultError("Failed to authenticate with Vault")
+            self.client = _get_authenticated_client(self.vault_url, self.vault_token, verify_ssl)
 
             logger.info(f"Successfully connected to Vault at {self.vault_url}")
 
@@ -95,6 +198,9 @@ class VaultClient:
         """
         Retrieve a secret from Vault.
 
+        Secrets are cached for secret_cache_ttl seconds; call invalidate()
+        after rotating a secret to read the new value straight away.
+
         Args:
             path: Secret path (e.g., "scylla-credentials")
 
@@ -105,6 +211,14 @@ class VaultClient:
             InvalidPath: If secret path does not exist
             VaultError: If retrieval fails
         """
+        secret_data = self._secret_cache.get_or_load(
+            (self.mount_point, path), lambda: self._read_secret(path)
+        )
+        # Copy so callers cannot change the cached secret
+        return dict(secret_data)
+
+    def _read_secret(self, path: str) -> Dict[str, Any]:
+        """Read a secret from Vault, bypassing the cache."""
         full_path = f"{self.mount_point}/data/{path}"
 
         try:
@@ -129,6 +243,18 @@ class VaultClient:
             logger.error(f"Failed to retrieve secret from {path}: {e}")
             raise VaultError(f"Secret retrieval failed: {e}")
 
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drop cached secrets so the next read goes to Vault.
+
+        Args:
+            path: Secret path to drop; all cached secrets if not given
+        """
+        if path is None:
+            self._secret_cache.clear()
+        else:
+            self._secret_cache.invalidate(lambda key: key[1] == path)
+
     def get_database_credentials(self, database: str) -> Dict[str, str]:
         """
         Retrieve database credentials from Vault.
@@ -143,12 +269,11 @@ class VaultClient:
             ValueError: If database identifier is invalid
             VaultError: If retrieval fails
         """
-        valid_databases = ["scylla", "postgres"]
-
-        if database not in valid_databases:
-            raise ValueError(f"Invalid database: {database}. Must be one of {valid_databases}")
-
-        path = f"{database}-credentials"
+        path = _DATABASE_SECRET_PATHS.get(database)
+        if path is None:
+            raise ValueError(
+                f"Invalid database: {database}. Must be one of {list(_DATABASE_SECRET_PATHS)}"
+            )
 
         try:
             credentials = self.get_secret(path)
@@ -212,7 +337,7 @@ class VaultClient:
         """
         try:
             # Check authentication
-            is_authenticated = self.client.is_authenticated()
+            is_authenticated = self._is_authenticated()
 
             if not is_authenticated:
                 logger.warning("Vault authentication check failed")
@@ -249,6 +374,17 @@ class VaultClient:
                 error=str(e)
             )
 
+    def _is_authenticated(self) -> bool:
+        """Check authentication, trusting a successful check for _AUTH_CHECK_TTL seconds."""
+        now = time.monotonic()
+        if now < self._auth_ok_until:
+            return True
+
+        authenticated = self.client.is_authenticated()
+        if authenticated:
+            self._auth_ok_until = now + _AUTH_CHECK_TTL
+        return authenticated
+
     def list_secrets(self, path: str = "") -> list:
         """
         List secrets at a given path.
@@ -275,7 +411,17 @@ class VaultClient:
             raise VaultError(f"Secret listing failed: {e}")
 
     def close(self):
-        """Close the Vault client connection."""
+        """
+        Close the Vault client connection.
+
+        The underlying hvac client is also dropped from the shared cache, so
+        later instances authenticate afresh; other open instances holding it
+        keep working.
+        """
+        if self.client is not None:
+            _evict_client(
+                _client_cache_key(self.vault_url, self.vault_token, self.verify_ssl), self.client
+            )
         self.client = None
         logger.info("Vault client connection closed")
 
@@ -0,0 +1,113 @@
+"""
+Unit tests for cache module.
+"""
+
+import pytest
+from src.utils.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced clock for expiry tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Test TTLCache behaviour."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create a manually advanced clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock):
+        """Create a small cache driven by the fake clock."""
+        return TTLCache(maxsize=2, ttl=10, timer=clock)
+
+    def test_get_returns_stored_value(self, cache):
+        """Test that a stored value is returned."""
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_get_missing_returns_default(self, cache):
+        """Test that a missing key returns the default."""
+        assert cache.get("missing") is None
+        assert cache.get("missing", "fallback") == "fallback"
+
+    def test_cached_none_is_distinguished_from_missing(self, cache):
+        """Test that None can be cached."""
+        cache.set("a", None)
+
+        assert "a" in cache
+
+    def test_entries_expire_after_ttl(self, cache, clock):
+        """Test that entries are dropped once their TTL has passed."""
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+
+        clock.now = 10
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self, cache):
+        """Test LRU eviction when the cache is full."""
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_get_or_load_calls_loader_once(self, cache, mocker):
+        """Test that get_or_load only calls the loader on a miss."""
+        loader = mocker.Mock(return_value="value")
+
+        assert cache.get_or_load("a", loader) == "value"
+        assert cache.get_or_load("a", loader) == "value"
+        loader.assert_called_once_with()
+
+    def test_get_or_load_does_not_cache_errors(self, cache, mocker):
+        """Test that a failing loader leaves nothing cached."""
+        loader = mocker.Mock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load("a", loader)
+
+        assert "a" not in cache
+
+    def test_invalidate_removes_matching_keys(self, cache):
+        """Test predicate-based invalidation."""
+        cache.set(("subject", "a"), 1)
+        cache.set(("other", "b"), 2)
+
+        removed = cache.invalidate(lambda key: key[0] == "subject")
+
+        assert removed == 1
+        assert ("subject", "a") not in cache
+        assert ("other", "b") in cache
+
+    def test_clear(self, cache):
+        """Test that clear removes all entries."""
+        cache.set("a", 1)
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_invalid_arguments(self):
+        """Test that invalid sizes and TTLs are rejected."""
+        with pytest.raises(ValueError, match="maxsize"):
+            TTLCache(maxsize=0)
+        with pytest.raises(ValueError, match="ttl"):
+            TTLCache(ttl=-1)
@@ -4,14 +4,93 @@ Unit tests for schema_validator module.
 
 import pytest
 import json
+import logging
 from src.utils.schema_validator import (
     SchemaValidator,
     SchemaValidationError,
     SchemaCompatibilityError,
     CompatibilityMode,
-    SchemaType
+    SchemaType,
+    SchemaRegistryError
 )
 
+# Schema served by the fake registry in the client request tests
+REGISTRY_SCHEMA = {"type": "record", "name": "Test", "fields": []}
+
+
+class FakeResponse:
+    """Registry response stand-in carrying a decoded JSON body."""
+
+    __slots__ = ("_json",)
+
+    def __init__(self, body):
+        self._json = body
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """
+    Registry session stand-in that records requests.
+
+    Responses are looked up by URL in routes; a callable route is called
+    with the URL to build the body.
+    """
+
+    def __init__(self):
+        self.headers = {}
+        self.routes = {}
+        self.calls = []
+
+    def urls(self, method):
+        """Return the URLs requested with an HTTP method, in order."""
+        return [url for call_method, url, _ in self.calls if call_method == method]
+
+    def _request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        body = self.routes[url]
+        return FakeResponse(body(url) if callable(body) else body)
+
+    def get(self, url, **kwargs):
+        return self._request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._request("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self._request("DELETE", url, **kwargs)
+
+
+class ListHandler(logging.Handler):
+    """Logging handler that keeps each record's message."""
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def warning_log():
+    """Collect warnings logged by the schema validator module."""
+    validator_logger = logging.getLogger("src.utils.schema_validator")
+    handler = ListHandler(logging.WARNING)
+    previous_level = validator_logger.level
+    validator_logger.addHandler(handler)
+    validator_logger.setLevel(logging.WARNING)
+    yield handler
+    validator_logger.removeHandler(handler)
+    validator_logger.setLevel(previous_level)
+
 
 class TestSchemaValidation:
     """Test schema validation functionality."""
@@ -48,6 +127,15 @@ class TestSchemaValidation:
         with pytest.raises(SchemaValidationError, match="missing required fields"):
             validator.validate_avro_schema(schema)
 
+    def test_validate_avro_schema_explicit_none_is_present(self, validator, warning_log):
+        """Test that a key set to None counts as present, not missing."""
+        with pytest.raises(SchemaValidationError, match="Invalid schema type"):
+            validator.validate_avro_schema({"type": None, "name": "User", "namespace": "com.example"})
+
+        schema = {"type": "record", "name": "User", "namespace": None, "fields": []}
+        assert validator.validate_avro_schema(schema) is True
+        assert warning_log.messages == []
+
     def test_validate_avro_schema_not_dict(self, validator):
         """Test that non-dictionary schema raises error."""
         with pytest.raises(SchemaValidationError, match="must be a dictionary"):
@@ -111,6 +199,116 @@ class TestSchemaValidation:
         with pytest.raises(SchemaValidationError, match="Field must be a dictionary"):
             validator.validate_avro_schema(schema)
 
+    def test_validate_avro_schema_nested_record_without_fields(self, validator):
+        """Test that nested record definitions are validated too."""
+        schema = {
+            "type": "record",
+            "name": "Order",
+            "fields": [
+                {"name": "id", "type": "string"},
+                {"name": "customer", "type": ["null", {"type": "record", "name": "Customer"}]}
+            ]
+        }
+
+        with pytest.raises(SchemaValidationError, match="must have 'fields'"):
+            validator.validate_avro_schema(schema)
+
+    def test_validate_avro_schema_nested_record_without_name(self, validator):
+        """Test that nested record definitions must be named."""
+        schema = {
+            "type": "record",
+            "name": "Order",
+            "fields": [{"name": "customer", "type": {"type": "record", "fields": []}}]
+        }
+
+        with pytest.raises(SchemaValidationError, match="Nested record in field 'customer'"):
+            validator.validate_avro_schema(schema)
+
+    @pytest.mark.parametrize("name", [None, 42])
+    def test_validate_avro_schema_nested_record_with_non_string_name(self, validator, name):
+        """Test that a nested record name must be a string, not merely present."""
+        schema = {
+            "type": "record",
+            "name": "Order",
+            "fields": [{"name": "customer", "type": {"type": "record", "name": name, "fields": []}}]
+        }
+
+        with pytest.raises(SchemaValidationError, match="Nested record in field 'customer' has a non-string name"):
+            validator.validate_avro_schema(schema)
+
+    @pytest.mark.parametrize("field_type", [
+        {"type": "array", "items": {"type": "record", "name": "Line"}},
+        {"type": "map", "values": {"type": "record", "name": "Line"}},
+        ["null", {"type": "array", "items": {"type": "map", "values": {"type": "record", "name": "Line"}}}],
+    ])
+    def test_validate_avro_schema_record_in_collection_validated(self, validator, field_type):
+        """Test that records nested in array items and map values are validated too."""
+        schema = {"type": "record", "name": "Order", "fields": [{"name": "lines", "type": field_type}]}
+
+        with pytest.raises(SchemaValidationError, match="must have 'fields'"):
+            validator.validate_avro_schema(schema)
+
+    def test_validate_avro_schema_record_in_array_without_name(self, validator):
+        """Test that records nested in array items must be named."""
+        schema = {
+            "type": "record",
+            "name": "Order",
+            "fields": [{"name": "lines", "type": {"type": "array", "items": {"type": "record", "fields": []}}}]
+        }
+
+        with pytest.raises(SchemaValidationError, match="Nested record in field 'lines'"):
+            validator.validate_avro_schema(schema)
+
+    def test_validate_avro_schema_nested_field_without_type(self, validator):
+        """Test that field rules apply to nested record fields."""
+        schema = {
+            "type": "record",
+            "name": "Order",
+            "fields": [{
+                "name": "customer",
+                "type": {"type": "record", "name": "Customer", "fields": [{"name": "email"}]}
+            }]
+        }
+
+        with pytest.raises(SchemaValidationError, match="Field 'email' must have a 'type'"):
+            validator.validate_avro_schema(schema)
+
+    def test_record_rules_apply_only_to_records(self, validator, mocker):
+        """Test that the record rules run for record schemas only."""
+        import src.utils.schema_validator as schema_validator
+
+        spy = mocker.spy(schema_validator, "_validate_record")
+        record = {"type": "record", "name": "User", "fields": []}
+        enum = {"type": "enum", "name": "Color", "symbols": ["RED"]}
+
+        validator.validate_avro_schema(record)
+        validator.validate_avro_schema(enum)
+
+        spy.assert_called_once_with(record)
+
+    def test_validation_sees_in_place_mutation(self, validator):
+        """Test that a schema mutated after passing validation is validated again."""
+        record = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        assert validator.validate_avro_schema(record) is True
+
+        record["fields"].append({"name": "bad"})
+
+        with pytest.raises(SchemaValidationError, match="type"):
+            validator.validate_avro_schema(record)
+
+    def test_validation_repeats_per_call_checks(self, validator):
+        """Test that namespace and invalid-schema checks run on every call."""
+        strict = SchemaValidator(strict_mode=True)
+        record = {"type": "record", "name": "User", "fields": []}
+        broken = {"type": "record", "name": "User", "fields": "id"}
+
+        strict.validate_avro_schema(record, warn_missing_namespace=False)
+        with pytest.raises(SchemaValidationError, match="namespace"):
+            strict.validate_avro_schema(record)
+        for _ in range(2):
+            with pytest.raises(SchemaValidationError, match="must be a list"):
+                validator.validate_avro_schema(broken)
+
 
 class TestBackwardCompatibility:
     """Test backward compatibility checking."""
@@ -226,6 +424,35 @@ class TestBackwardCompatibility:
 
         assert validator.check_backward_compatibility(schema, schema) is True
 
+    def test_backward_compatible_equal_schemas_skip_field_checks(self, validator, mocker):
+        """Test that structurally equal schemas short-circuit the field walk."""
+        spy = mocker.spy(SchemaValidator, "_check_backward")
+        schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        same_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+
+        assert validator.check_backward_compatibility(schema, schema) is True
+        assert validator.check_backward_compatibility(same_schema, schema) is True
+        assert spy.call_count == 0
+
+    def test_backward_equal_schemas_compared_by_current_content(self, validator):
+        """Test that a schema edited in place no longer counts as equal."""
+        old_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        new_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+
+        assert validator.check_backward_compatibility(new_schema, old_schema) is True
+
+        new_schema["fields"][0]["type"] = "int"
+
+        with pytest.raises(SchemaCompatibilityError, match="type changed incompatibly"):
+            validator.check_backward_compatibility(new_schema, old_schema)
+
+    def test_backward_same_schema_still_validated(self, validator):
+        """Test that the identity fast path does not skip validation."""
+        schema = {"type": "record", "name": "User"}
+
+        with pytest.raises(SchemaValidationError, match="must have 'fields'"):
+            validator.check_backward_compatibility(schema, schema)
+
 
 class TestForwardCompatibility:
     """Test forward compatibility checking."""
@@ -334,6 +561,117 @@ class TestFullCompatibility:
         with pytest.raises(SchemaCompatibilityError):
             validator.check_full_compatibility(new_schema, old_schema)
 
+    def test_violation_reported_as_reason_code(self, validator):
+        """Test that the direction checks return reason codes instead of raising."""
+        from src.utils.schema_validator import _backward_violation, _forward_violation
+
+        old = validator._canonicalize({
+            "type": "record",
+            "name": "User",
+            "fields": [{"name": "id", "type": "string"}, {"name": "age", "type": "int"}]
+        })
+        new = validator._canonicalize({
+            "type": "record",
+            "name": "User",
+            "fields": [{"name": "id", "type": "string"}, {"name": "age", "type": "string"}]
+        })
+        trimmed = validator._canonicalize({
+            "type": "record",
+            "name": "User",
+            "fields": [{"name": "id", "type": "string"}]
+        })
+
+        assert _backward_violation(old, old) is None
+        assert _backward_violation(new, old) == ("field_type_changed", "age")
+        assert _forward_violation(trimmed, old) == ("field_missing", "age")
+
+    def test_unchanged_field_types_skip_type_resolution(self, validator, mocker):
+        """Test that only fields whose type changed are resolved."""
+        import src.utils.schema_validator as schema_validator
+
+        spy = mocker.spy(schema_validator, "_types_compatible")
+        old_schema = {"type": "record", "name": "User", "fields": [
+            {"name": "id", "type": "string"},
+            {"name": "age", "type": "int"}
+        ]}
+        new_schema = {"type": "record", "name": "User", "fields": [
+            {"name": "id", "type": "string"},
+            {"name": "age", "type": "long"}
+        ]}
+
+        assert validator.check_backward_compatibility(new_schema, old_schema) is True
+        spy.assert_called_once_with("long", "int")
+
+    def test_first_removed_field_reported_in_declaration_order(self, validator):
+        """Test that the reported field does not depend on set iteration order."""
+        names = [f"field_{i}" for i in range(50)]
+        old_schema = {
+            "type": "record",
+            "name": "Wide",
+            "fields": [{"name": name, "type": "string"} for name in names]
+        }
+        new_schema = {
+            "type": "record",
+            "name": "Wide",
+            "fields": [{"name": name, "type": "string"} for name in names[:10] + names[30:]]
+        }
+
+        with pytest.raises(SchemaCompatibilityError, match="Field 'field_10' removed"):
+            validator.check_full_compatibility(new_schema, old_schema)
+
+    def test_full_compatibility_validates_each_schema_once(self, validator, mocker):
+        """Test that the full check validates each schema a single time."""
+        old_schema = {
+            "type": "record",
+            "name": "User",
+            "fields": [{"name": "id", "type": "string"}]
+        }
+        new_schema = {
+            "type": "record",
+            "name": "User",
+            "fields": [
+                {"name": "id", "type": "string"},
+                {"name": "email", "type": "string", "default": ""}
+            ]
+        }
+        validate = mocker.spy(validator, "validate_avro_schema")
+
+        assert validator.check_full_compatibility(new_schema, old_schema) is True
+        assert validate.call_count == 2
+
+    def test_full_compatibility_indexes_each_schema_once(self, validator, mocker):
+        """Test that both directions of a full check share the field indexes."""
+        import src.utils.schema_validator as schema_validator
+
+        spy = mocker.spy(schema_validator, "_index_fields")
+        old_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        new_schema = {"type": "record", "name": "User", "fields": [
+            {"name": "id", "type": "string"},
+            {"name": "email", "type": "string", "default": ""}
+        ]}
+
+        assert validator.check_full_compatibility(new_schema, old_schema) is True
+        assert spy.call_count == 2
+
+    def test_full_incompatible_removed_field(self, validator):
+        """Test that a removed field fails a full check."""
+        old_schema = {
+            "type": "record",
+            "name": "User",
+            "fields": [
+                {"name": "id", "type": "string"},
+                {"name": "email", "type": "string", "default": ""}
+            ]
+        }
+        new_schema = {
+            "type": "record",
+            "name": "User",
+            "fields": [{"name": "id", "type": "string"}]
+        }
+
+        with pytest.raises(SchemaCompatibilityError, match="removed"):
+            validator.check_full_compatibility(new_schema, old_schema)
+
 
 class TestTypeCompatibility:
     """Test type compatibility checking."""
@@ -364,11 +702,83 @@ class TestTypeCompatibility:
         assert validator._is_type_compatible("int", "string") is False
         assert validator._is_type_compatible("string", "int") is False
 
+    def test_primitive_pairs_bypass_memo_cache(self, validator):
+        """Test that primitive pairs are resolved by table lookup alone."""
+        from src.utils.schema_validator import _types_compatible_cached
+
+        before = _types_compatible_cached.cache_info()
+        assert validator._is_type_compatible("double", "int") is True
+        assert validator._is_type_compatible("int", "double") is False
+        after = _types_compatible_cached.cache_info()
+
+        assert (after.hits, after.misses) == (before.hits, before.misses)
+
     def test_union_type_compatibility(self, validator):
         """Test union type compatibility."""
         assert validator._is_type_compatible(["string", "null"], ["string", "null"]) is True
         assert validator._is_type_compatible(["string", "int", "null"], ["string", "null"]) is True
 
+    def test_union_branches_allow_promotion(self, validator):
+        """Test that union branches are matched with type promotion."""
+        assert validator._is_type_compatible(["null", "long"], ["null", "int"]) is True
+        assert validator._is_type_compatible(["null", "double"], ["int", "float", "null"]) is True
+
+    def test_union_missing_branch_incompatible(self, validator):
+        """Test that every old branch must be readable by the new union."""
+        assert validator._is_type_compatible(["null", "string"], ["null", "string", "int"]) is False
+        assert validator._is_type_compatible(["null", "int"], ["null", "long"]) is False
+
+    def test_union_branch_order_does_not_matter(self, validator):
+        """Test that reordered unions are treated as the same type."""
+        assert validator._is_type_compatible(["null", "string"], ["string", "null"]) is True
+        assert validator._is_type_compatible(["null", "long"], "int") is True
+
+    def test_equal_unions_share_one_cache_key(self):
+        """Test that equal primitive unions map to the same interned key."""
+        from src.utils.schema_validator import _type_cache_key
+
+        key = _type_cache_key(["string", "null"])
+
+        assert key == frozenset(("null", "string"))
+        assert _type_cache_key(["string", "null"]) is key
+        assert _type_cache_key(["null", "string"]) == key
+
+    def test_inline_record_type_compatibility(self, validator):
+        """Test that unions with inline record types bypass the memo cache."""
+        address = {"type": "record", "name": "Address", "fields": []}
+
+        assert validator._is_type_compatible(["null", address], address) is True
+        assert validator._is_type_compatible(address, "int") is False
+        assert validator._is_type_compatible("int", address) is False
+
+    def test_only_two_branch_nullable_unions_are_unwrapped(self, validator):
+        """Test that a nullable union is only unwrapped when it has one other branch."""
+        assert validator._is_type_compatible(["int", "null"], "int") is True
+        assert validator._is_type_compatible(["null", "int", "string"], "int") is False
+
+
+class TestSchemaErrors:
+    """Test schema error message formatting."""
+
+    def test_message_formatted_from_template(self):
+        """Test that template arguments are formatted when rendered."""
+        error = SchemaValidationError("Field '{}' must have a 'type' property", "id")
+
+        assert str(error) == "Field 'id' must have a 'type' property"
+        assert error.args == ("Field '{}' must have a 'type' property", "id")
+
+    def test_plain_message_used_verbatim(self):
+        """Test that a message without arguments is not formatted."""
+        error = SchemaCompatibilityError("Braces {} stay as-is")
+
+        assert str(error) == "Braces {} stay as-is"
+
+    def test_error_rebuilt_from_args(self):
+        """Test that an error can be recreated from its args."""
+        error = SchemaCompatibilityError("Field '{}' type changed incompatibly", "age")
+
+        assert str(type(error)(*error.args)) == str(error)
+
 
 class TestSchemaUtilities:
     """Test schema utility functions."""
@@ -386,6 +796,13 @@ class TestSchemaUtilities:
         assert schema["type"] == "record"
         assert schema["name"] == "User"
 
+    def test_parse_schema_non_ascii(self, validator):
+        """Test that non-ASCII names and docs survive parsing."""
+        schema_str = '{"type": "record", "name": "Usu\u00e1rio", "doc": "d\u00e9j\u00e0 vu", "fields": []}'
+        schema = validator.parse_schema(schema_str)
+
+        assert schema == json.loads(schema_str)
+
     def test_parse_schema_invalid_json(self, validator):
         """Test that invalid JSON raises error."""
         with pytest.raises(SchemaValidationError, match="Failed to parse"):
@@ -397,7 +814,20 @@ class TestSchemaUtilities:
         fingerprint = validator.get_schema_fingerprint(schema)
 
         assert isinstance(fingerprint, str)
-        assert len(fingerprint) == 64  # SHA256 hex digest length
+        assert len(fingerprint) == 64  # BLAKE2b-256 hex digest length
+
+    def test_get_schema_fingerprint_stable_value(self, validator):
+        """Test that the fingerprint algorithm does not change between environments."""
+        schema = {
+            "type": "record",
+            "name": "User",
+            "namespace": "com.example",
+            "fields": [{"name": "id", "type": "string"}]
+        }
+
+        assert validator.get_schema_fingerprint(schema) == (
+            "167e03ea78a5c1e67eb1b6924cff3ee9e61884b1dfa6360e9b185d67976415f7"
+        )
 
     def test_get_schema_fingerprint_consistent(self, validator):
         """Test that fingerprint is consistent for same schema."""
@@ -418,6 +848,154 @@ class TestSchemaUtilities:
 
         assert fingerprint1 != fingerprint2
 
+    def test_get_schema_fingerprint_ignores_documentation(self, validator):
+        """Test that documentation-only changes keep the fingerprint."""
+        schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        documented = {
+            "type": "record",
+            "name": "User",
+            "doc": "A user",
+            "aliases": ["Person"],
+            "fields": [{"name": "id", "type": "string", "doc": "Primary key"}]
+        }
+
+        assert validator.get_schema_fingerprint(documented) == validator.get_schema_fingerprint(schema)
+        assert (
+            validator.get_schema_fingerprint(documented, include_meta=True)
+            != validator.get_schema_fingerprint(schema, include_meta=True)
+        )
+
+    def test_get_schema_fingerprint_keeps_default_values(self, validator):
+        """Test that field defaults are hashed even if they contain meta-like keys."""
+        def schema_with_default(default):
+            return {
+                "type": "record",
+                "name": "Wrapper",
+                "fields": [{"name": "info", "type": {"type": "map", "values": "string"}, "default": default}]
+            }
+
+        assert (
+            validator.get_schema_fingerprint(schema_with_default({"doc": "a"}))
+            != validator.get_schema_fingerprint(schema_with_default({"doc": "b"}))
+        )
+
+    def test_compatibility_checks_do_not_copy_schemas(self, validator, monkeypatch):
+        """Test that internal cache keys hash schemas without a stripped copy."""
+        import src.utils.schema_validator as schema_validator
+
+        def fail(node):
+            raise AssertionError("schema copied for an internal fingerprint")
+
+        monkeypatch.setattr(schema_validator, "_strip_meta", fail)
+        old_schema = {"type": "record", "name": "User", "doc": "v1", "fields": [
+            {"name": "id", "type": "string"}
+        ]}
+        new_schema = {"type": "record", "name": "User", "doc": "v2", "fields": [
+            {"name": "id", "type": "string"},
+            {"name": "email", "type": "string", "default": ""}
+        ]}
+
+        assert validator.check_compatibility(new_schema, old_schema, CompatibilityMode.BACKWARD)
+        assert validator._canonicalize(new_schema).fields_by_name["email"]["default"] == ""
+
+    def test_get_schema_fingerprint_tracks_in_place_changes(self, validator):
+        """Test that fingerprints follow a schema mutated in place."""
+        schema = {"type": "record", "name": "User", "fields": []}
+        before = validator.get_schema_fingerprint(schema)
+
+        schema["fields"].append({"name": "id", "type": "string"})
+
+        assert validator.get_schema_fingerprint(schema) != before
+        assert validator.get_schema_fingerprint(schema) == validator.get_schema_fingerprint(
+            {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        )
+
+    def test_compat_cache_shared_across_threads(self, validator, monkeypatch):
+        """Test that the compatibility result cache stays consistent under concurrent use."""
+        from concurrent.futures import ThreadPoolExecutor
+        import src.utils.schema_validator as schema_validator
+
+        # A tiny cache keeps eviction racing with lookups
+        monkeypatch.setattr(schema_validator, "_COMPAT_CACHE_SIZE", 4)
+        old_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        schemas = [
+            {"type": "record", "name": "User", "fields": [
+                {"name": "id", "type": "string"},
+                {"name": f"field{i}", "type": "string", **({"default": ""} if i % 2 else {})}
+            ]}
+            for i in range(16)
+        ]
+        expected = [validator.is_compatible(schema, old_schema) for schema in schemas]
+
+        def work(round_number):
+            rotated = schemas[round_number % 4:] + schemas[:round_number % 4]
+            for schema in rotated:
+                validator.is_compatible(schema, old_schema)
+            return [validator.is_compatible(schema, old_schema) for schema in schemas]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(work, range(64)))
+
+        assert all(result == expected for result in results)
+        assert expected == [bool(i % 2) for i in range(16)]
+        assert len(validator._compat_cache) <= 4
+
+    def test_canonicalize_builds_read_only_view(self, validator):
+        """Test that canonical views are read-only and follow in-place changes."""
+        schema = {
+            "type": "record",
+            "name": "User",
+            "namespace": "com.example",
+            "fields": [{"name": "id", "type": "string"}, {"name": "age", "type": "int"}]
+        }
+
+        canonical = validator._canonicalize(schema)
+
+        assert list(canonical.fields_by_name) == ["id", "age"]
+        assert canonical.namespace == "com.example"
+        assert canonical.fingerprint == validator.get_schema_fingerprint(schema, include_meta=True)
+        with pytest.raises(TypeError):
+            canonical.fields_by_name["email"] = {"name": "email", "type": "string"}
+
+        schema["fields"].append({"name": "email", "type": "string"})
+        assert "email" in validator._canonicalize(schema).fields_by_name
+
+    def test_canonicalize_interns_field_names(self, validator):
+        """Test that equal field names from different schemas share one object."""
+        name1 = "".join(["user", "_id"])
+        name2 = "".join(["user", "_id"])
+        schema1 = {"type": "record", "name": "User", "fields": [{"name": name1, "type": "string"}]}
+        schema2 = {"type": "record", "name": "User", "fields": [{"name": name2, "type": "long"}]}
+
+        key1, = validator._canonicalize(schema1).fields_by_name
+        key2, = validator._canonicalize(schema2).fields_by_name
+
+        assert name1 is not name2
+        assert key1 is key2
+
+    def test_get_schema_fingerprints_preserves_order(self, validator):
+        """Test batch fingerprinting matches per-schema fingerprints."""
+        schemas = [
+            {"type": "record", "name": "User", "fields": []},
+            {"type": "record", "name": "Product", "fields": []}
+        ]
+
+        fingerprints = validator.get_schema_fingerprints(schemas)
+
+        assert fingerprints == [validator.get_schema_fingerprint(s) for s in schemas]
+
+    def test_canonical_json_matches_stdlib_encoding(self):
+        """Test that orjson and the stdlib fallback produce identical bytes."""
+        pytest.importorskip("orjson")
+        from src.utils.schema_validator import _canonical_json
+
+        schema = {"type": "record", "name": "Usér", "fields": [{"type": "int", "name": "id"}]}
+        expected = json.dumps(
+            schema, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+        ).encode()
+
+        assert _canonical_json(schema) == expected
+
 
 class TestCompatibilityModes:
     """Test compatibility mode functionality."""
@@ -521,6 +1099,167 @@ class TestCompatibilityModes:
         with pytest.raises(ValueError, match="Unknown compatibility mode"):
             validator.check_compatibility(schema, schema, mode=InvalidMode())
 
+    def test_overridden_direction_check_used_by_every_entry_point(self):
+        """Test that a subclass's direction check is used by every mode that runs it."""
+        class FrozenForward(SchemaValidator):
+            def _check_forward(self, new, old):
+                return ("field_missing", "email")
+
+        validator = FrozenForward()
+        old_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        new_schema = {"type": "record", "name": "User", "fields": [
+            {"name": "id", "type": "string"},
+            {"name": "email", "type": "string", "default": ""}
+        ]}
+
+        assert validator.check_backward_compatibility(new_schema, old_schema) is True
+        with pytest.raises(SchemaCompatibilityError, match="Field 'email' removed"):
+            validator.check_forward_compatibility(new_schema, old_schema)
+        with pytest.raises(SchemaCompatibilityError, match="Field 'email' removed"):
+            validator.check_compatibility(new_schema, old_schema, CompatibilityMode.FULL)
+        assert validator.is_compatible(new_schema, old_schema, CompatibilityMode.FORWARD) is False
+
+    def test_check_compatibility_caches_results(self, mocker):
+        """Test that repeated checks of the same schemas reuse the cached result."""
+        validator = SchemaValidator(CompatibilityMode.BACKWARD)
+        spy = mocker.spy(SchemaValidator, "_check_backward")
+
+        old_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        new_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "int"}]}
+
+        for _ in range(2):
+            with pytest.raises(SchemaCompatibilityError, match="type changed incompatibly"):
+                validator.check_compatibility(new_schema, old_schema)
+
+        assert validator.check_compatibility(old_schema, old_schema) is True
+        assert validator.check_compatibility(old_schema, old_schema) is True
+        assert spy.call_count == 1
+
+    def test_clear_schema_caches_forgets_results(self, mocker):
+        """Test that cleared results are computed again."""
+        validator = SchemaValidator(CompatibilityMode.BACKWARD)
+        spy = mocker.spy(SchemaValidator, "_check_backward")
+
+        old_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "int"}]}
+        new_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "long"}]}
+
+        assert validator.check_compatibility(new_schema, old_schema) is True
+        validator.clear_schema_caches()
+        assert validator.check_compatibility(new_schema, old_schema) is True
+        assert spy.call_count == 2
+
+    def test_check_compatibility_cache_misses_after_in_place_mutation(self):
+        """Test that a cached result is not reused once a schema changes in place."""
+        validator = SchemaValidator(CompatibilityMode.BACKWARD)
+        old_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        new_schema = {"type": "record", "name": "User", "fields": [
+            {"name": "id", "type": "string"},
+            {"name": "name", "type": "string", "default": ""}
+        ]}
+
+        assert validator.check_backward_compatibility(new_schema, old_schema) is True
+
+        new_schema["fields"].append({"name": "email", "type": "string"})
+
+        with pytest.raises(SchemaCompatibilityError, match="without default"):
+            validator.check_backward_compatibility(new_schema, old_schema)
+
+    def test_compat_cache_keys_bytes_defaults(self, mocker):
+        """Test that schemas with bytes defaults are cached by default value."""
+        validator = SchemaValidator(CompatibilityMode.BACKWARD)
+        spy = mocker.spy(SchemaValidator, "_check_backward")
+        old_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+
+        def with_default(default):
+            return {"type": "record", "name": "User", "fields": [
+                {"name": "id", "type": "string"},
+                {"name": "b", "type": "bytes", "default": default}
+            ]}
+
+        assert validator.check_compatibility(with_default(b"\x00"), old_schema) is True
+        assert validator.check_compatibility(with_default(b"\x00"), old_schema) is True
+        assert spy.call_count == 1
+        assert len(validator._compat_cache) == 1
+
+        assert validator.check_compatibility(with_default(b"\xff"), old_schema) is True
+        assert spy.call_count == 2
+        assert len(validator._compat_cache) == 2
+
+    def test_is_compatible_returns_bool(self):
+        """Test that is_compatible reports incompatibility without raising."""
+        validator = SchemaValidator(CompatibilityMode.FULL)
+        old_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        new_schema = {"type": "record", "name": "User", "fields": [
+            {"name": "id", "type": "string"},
+            {"name": "email", "type": "string"}
+        ]}
+
+        assert validator.is_compatible(new_schema, old_schema) is False
+        assert validator.is_compatible(old_schema, old_schema) is True
+        assert validator.is_compatible(new_schema, old_schema, CompatibilityMode.NONE) is True
+        with pytest.raises(SchemaCompatibilityError, match="without default"):
+            validator.check_compatibility(new_schema, old_schema)
+
+    def test_is_compatible_still_validates(self):
+        """Test that invalid schemas and modes still raise."""
+        validator = SchemaValidator()
+        schema = {"type": "record", "name": "User", "fields": []}
+
+        with pytest.raises(SchemaValidationError):
+            validator.is_compatible({"type": "record", "name": "User"}, schema)
+        with pytest.raises(ValueError, match="Unknown compatibility mode"):
+            validator.is_compatible(schema, schema, mode="INVALID")
+
+    def test_is_compatible_rejects_schema_edited_after_approval(self):
+        """Test that an approved schema edited in place is checked again."""
+        validator = SchemaValidator(CompatibilityMode.FULL)
+        old_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        new_schema = {"type": "record", "name": "User", "fields": [
+            {"name": "id", "type": "string"},
+            {"name": "email", "type": "string", "default": ""}
+        ]}
+
+        assert validator.is_compatible(new_schema, old_schema) is True
+
+        del new_schema["fields"][1]["default"]
+
+        assert validator.is_compatible(new_schema, old_schema) is False
+
+    def test_backward_accepts_bytes_default(self):
+        """Test that a Python bytes default can be fingerprinted and checked."""
+        validator = SchemaValidator(CompatibilityMode.BACKWARD)
+        old_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        new_schema = {"type": "record", "name": "User", "fields": [
+            {"name": "id", "type": "string"},
+            {"name": "b", "type": "bytes", "default": b"\x00"}
+        ]}
+
+        assert validator.check_backward_compatibility(new_schema, old_schema) is True
+        assert validator.get_schema_fingerprint(new_schema) == validator.get_schema_fingerprint(
+            {**new_schema, "fields": [new_schema["fields"][0], {**new_schema["fields"][1], "default": "\u0000"}]}
+        )
+
+    def test_direct_checks_share_the_result_cache(self, mocker):
+        """Test that the per-direction methods are memoized and keyed by mode."""
+        validator = SchemaValidator()
+        backward = mocker.spy(SchemaValidator, "_check_backward")
+        forward = mocker.spy(SchemaValidator, "_check_forward")
+
+        old_schema = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]}
+        new_schema = {"type": "record", "name": "User", "fields": [
+            {"name": "id", "type": "string"},
+            {"name": "email", "type": "string", "default": ""}
+        ]}
+
+        assert validator.check_backward_compatibility(new_schema, old_schema) is True
+        assert validator.check_backward_compatibility(new_schema, old_schema) is True
+        assert validator.check_compatibility(new_schema, old_schema, CompatibilityMode.BACKWARD) is True
+        assert validator.check_full_compatibility(new_schema, old_schema) is True
+        assert validator.check_full_compatibility(new_schema, old_schema) is True
+
+        assert backward.call_count == 2
+        assert forward.call_count == 1
+
 
 class TestSchemaRegistryIntegration:
     """Test Schema Registry integration functionality."""
@@ -530,19 +1269,18 @@ class TestSchemaRegistryIntegration:
         """Create a SchemaValidator instance."""
         return SchemaValidator()
 
-    @pytest.fixture
-    def validator_with_registry_url(self, mocker):
-        """Create a SchemaValidator instance with schema registry URL."""
-        # Mock requests.Session to prevent actual HTTP calls
-        mock_session = mocker.Mock()
-        mocker.patch('requests.Session', return_value=mock_session)
-        return SchemaValidator(schema_registry_url="http://localhost:8081")
+    @pytest.fixture(scope="module")
+    def mock_client_factory(self):
+        """Build Schema Registry client mocks restricted to the client protocol."""
+        from unittest.mock import Mock
+        from src.utils.schema_validator import SchemaRegistryClientProtocol
+
+        return lambda: Mock(spec=SchemaRegistryClientProtocol)
 
     @pytest.fixture
-    def mock_registry_client(self, mocker):
+    def mock_registry_client(self, mock_client_factory):
         """Create a mock Schema Registry client."""
-        mock_client = mocker.Mock()
-        return mock_client
+        return mock_client_factory()
 
     def test_get_schema_by_id_success(self, validator, mock_registry_client):
         """Test retrieving schema by ID from registry."""
@@ -563,8 +1301,6 @@ class TestSchemaRegistryIntegration:
 
     def test_get_schema_by_id_not_found(self, validator, mock_registry_client):
         """Test handling of schema not found error."""
-        from src.utils.schema_validator import SchemaRegistryError
-
         mock_registry_client.get_schema_by_id.side_effect = Exception("Schema not found")
 
         validator.schema_registry_client = mock_registry_client
@@ -572,6 +1308,22 @@ class TestSchemaRegistryIntegration:
         with pytest.raises(SchemaRegistryError, match="Schema not found"):
             validator.get_schema_by_id(999)
 
+    def test_mock_registry_client_follows_protocol(self, mock_registry_client):
+        """Test that the client mock rejects methods the protocol does not define."""
+        with pytest.raises(AttributeError):
+            mock_registry_client.get_schema_by_name
+
+    def test_registry_error_chains_client_exception(self, validator, mock_registry_client):
+        """Test that registry errors keep the client's exception as their cause."""
+        cause = KeyError(999)
+        mock_registry_client.get_schema_by_id.side_effect = cause
+        validator.schema_registry_client = mock_registry_client
+
+        with pytest.raises(SchemaRegistryError, match="Failed to get schema 999") as exc_info:
+            validator.get_schema_by_id(999)
+
+        assert exc_info.value.__cause__ is cause
+
     def test_get_latest_schema_version(self, validator, mock_registry_client):
         """Test retrieving latest schema version for a subject."""
         schema_dict = {
@@ -678,7 +1430,11 @@ class TestSchemaRegistryIntegration:
             ]
         }
 
-        mock_registry_client.get_schema_by_version.side_effect = [version1_schema, version2_schema]
+        # Versions are fetched concurrently, so resolve by version, not call order
+        versions = {1: version1_schema, 2: version2_schema}
+        mock_registry_client.get_schema_by_version.side_effect = (
+            lambda subject, version: versions[version]
+        )
 
         validator.schema_registry_client = mock_registry_client
         diff = validator.get_schema_diff("user-topic-value", 1, 2)
@@ -686,6 +1442,98 @@ class TestSchemaRegistryIntegration:
         assert "added_fields" in diff
         assert "removed_fields" in diff
         assert "email" in diff["added_fields"]
+        assert diff["removed_fields"] == []
+
+    def test_get_schema_versions_diff_all_changes(self, validator, mock_registry_client):
+        """Test that added, removed and changed fields are reported in field order."""
+        versions = {
+            1: {"type": "record", "name": "User", "fields": [
+                {"name": "id", "type": "string"},
+                {"name": "age", "type": "int"},
+                {"name": "nickname", "type": "string"},
+                {"name": "score", "type": "int"}
+            ]},
+            2: {"type": "record", "name": "User", "fields": [
+                {"name": "id", "type": "string"},
+                {"name": "age", "type": "long"},
+                {"name": "score", "type": "double"},
+                {"name": "email", "type": "string", "default": ""},
+                {"name": "phone", "type": "string", "default": ""}
+            ]},
+        }
+        mock_registry_client.get_schema_by_version.side_effect = (
+            lambda subject, version: versions[version]
+        )
+
+        validator.schema_registry_client = mock_registry_client
+        diff = validator.get_schema_diff("user-topic-value", 1, 2)
+
+        assert diff == {
+            "added_fields": ["email", "phone"],
+            "removed_fields": ["nickname"],
+            "changed_fields": ["age", "score"]
+        }
+
+    def test_get_schema_versions_diff_large_schema_keeps_field_order(self, validator, mock_registry_client):
+        """Test that diffs of wide schemas list fields in schema order."""
+        old_fields = [{"name": f"f{index}", "type": "string"} for index in range(500)]
+        new_fields = [
+            {"name": field["name"], "type": "long" if index % 100 == 7 else "string"}
+            for index, field in enumerate(old_fields) if index % 50 != 3
+        ] + [{"name": "z_added", "type": "int"}, {"name": "a_added", "type": "int"}]
+        versions = {
+            1: {"type": "record", "name": "Wide", "fields": old_fields},
+            2: {"type": "record", "name": "Wide", "fields": new_fields},
+        }
+        mock_registry_client.get_schema_by_version.side_effect = (
+            lambda subject, version: versions[version]
+        )
+
+        validator.schema_registry_client = mock_registry_client
+        diff = validator.get_schema_diff("wide-topic-value", 1, 2)
+
+        assert diff == {
+            "added_fields": ["z_added", "a_added"],
+            "removed_fields": [f"f{index}" for index in range(3, 500, 50)],
+            "changed_fields": [f"f{index}" for index in range(7, 500, 100)],
+        }
+
+    def test_get_schema_versions_diff_identical_versions(self, validator, mock_registry_client):
+        """Test that versions differing only in documentation have an empty diff."""
+        fields = [{"name": "id", "type": "string"}]
+        versions = {
+            1: {"type": "record", "name": "User", "fields": fields},
+            2: {"type": "record", "name": "User", "doc": "Users", "fields": fields},
+        }
+        mock_registry_client.get_schema_by_version.side_effect = (
+            lambda subject, version: versions[version]
+        )
+
+        validator.schema_registry_client = mock_registry_client
+        diff = validator.get_schema_diff("user-topic-value", 1, 2)
+
+        assert diff == {"added_fields": [], "removed_fields": [], "changed_fields": []}
+
+    def test_get_schema_diff_same_version_fetched_once(self, validator, mock_registry_client):
+        """Test that diffing a version against itself makes a single fetch."""
+        mock_registry_client.get_schema_by_version.return_value = {
+            "type": "record", "name": "User", "fields": [{"name": "id", "type": "string"}]
+        }
+
+        validator.schema_registry_client = mock_registry_client
+        diff = validator.get_schema_diff("user-topic-value", 3, 3)
+
+        assert diff == {"added_fields": [], "removed_fields": [], "changed_fields": []}
+        mock_registry_client.get_schema_by_version.assert_called_once_with("user-topic-value", 3)
+
+    def test_get_schema_versions_diff_version_not_found(self, validator, mock_registry_client):
+        """Test that a failed version fetch surfaces as a registry error."""
+        mock_registry_client.get_schema_by_version.side_effect = Exception("Version not found")
+
+        validator.schema_registry_client = mock_registry_client
+
+        with pytest.raises(SchemaRegistryError, match="Failed to get schema diff"):
+            validator.get_schema_diff("user-topic-value", 1, 99)
 
     def test_list_subjects(self, validator, mock_registry_client):
         """Test listing all subjects in registry."""
@@ -709,10 +1557,139 @@ class TestSchemaRegistryIntegration:
         assert result is True
         mock_registry_client.delete_schema_version.assert_called_once_with("user-topic-value", 1)
 
+    def test_registry_reads_are_cached(self, validator, mock_registry_client):
+        """Test that repeated registry reads are served from the cache."""
+        mock_registry_client.get_schema_by_id.return_value = {"type": "string"}
+        mock_registry_client.list_subjects.return_value = ["user-topic-value"]
+
+        validator.schema_registry_client = mock_registry_client
+        first = validator.get_schema_by_id(1)
+        second = validator.get_schema_by_id(1)
+        validator.list_subjects()
+        validator.list_subjects()
+
+        assert first == second
+        mock_registry_client.get_schema_by_id.assert_called_once_with(1)
+        mock_registry_client.list_subjects.assert_called_once_with()
+
+    def test_cached_registry_reads_return_copies(self, validator, mock_registry_client):
+        """Test that mutating a cached registry read does not change later reads."""
+        mock_registry_client.get_schema_by_id.return_value = {"type": "string"}
+        mock_registry_client.list_subjects.return_value = ["user-topic-value"]
+
+        validator.schema_registry_client = mock_registry_client
+        validator.get_schema_by_id(1)["type"] = "int"
+        validator.list_subjects().append("other-topic-value")
+
+        assert validator.get_schema_by_id(1) == {"type": "string"}
+        assert validator.list_subjects() == ["user-topic-value"]
+        mock_registry_client.get_schema_by_id.assert_called_once_with(1)
+        mock_registry_client.list_subjects.assert_called_once_with()
+
+    def test_register_schema_invalidates_cached_reads(self, validator, mock_registry_client):
+        """Test that writes drop cached reads made stale by them."""
+        new_schema = {"type": "record", "name": "User", "fields": [
+            {"name": "email", "type": "string", "default": ""}
+        ]}
+        mock_registry_client.list_subjects.side_effect = [[], ["user-topic-value"]]
+        mock_registry_client.register_schema.return_value = 2
+
+        validator.schema_registry_client = mock_registry_client
+        assert validator.list_subjects() == []
+        validator.register_schema("user-topic-value", new_schema)
+
+        assert validator.list_subjects() == ["user-topic-value"]
+
+    def test_latest_schema_version_not_cached_by_validator(self, validator, mock_registry_client):
+        """Test that the validator leaves caching of the latest version to the client."""
+        schema = {"type": "record", "name": "User", "fields": []}
+        mock_registry_client.get_latest_schema_version.side_effect = [(1, schema), (2, schema)]
+
+        validator.schema_registry_client = mock_registry_client
+
+        assert validator.get_latest_schema_version("user-topic-value")[0] == 1
+        assert validator.get_latest_schema_version("user-topic-value")[0] == 2
+
+    def test_register_schema_skips_registry_for_known_schema(self, validator, mock_registry_client):
+        """Test that re-registering the same schema returns the cached ID."""
+        schema = {"type": "record", "name": "User", "fields": []}
+        mock_registry_client.register_schema.side_effect = [1, 2]
+
+        validator.schema_registry_client = mock_registry_client
+        assert validator.register_schema("user-topic-value", schema) == 1
+        assert validator.register_schema("user-topic-value", dict(schema)) == 1
+        mock_registry_client.register_schema.assert_called_once()
+
+        validator.register_schema("other-topic-value", schema)
+        assert mock_registry_client.register_schema.call_count == 2
+
+    def test_register_schemas_batch(self, validator, mock_registry_client):
+        """Test that a batch registration returns IDs in input order."""
+        user = {"type": "record", "name": "User", "fields": []}
+        order = {"type": "record", "name": "Order", "fields": []}
+        ids = {"user-topic-value": 1, "order-topic-value": 2}
+        mock_registry_client.register_schema.side_effect = lambda subject, schema: ids[subject]
+
+        validator.schema_registry_client = mock_registry_client
+        result = validator.register_schemas([("user-topic-value", user), ("order-topic-value", order)])
+
+        assert result == [1, 2]
+        assert mock_registry_client.register_schema.call_count == 2
+
+    def test_register_schemas_partial_failure(self, validator, mock_registry_client):
+        """Test that a failed item is reported by subject and the rest still register."""
+        schema = {"type": "record", "name": "User", "fields": []}
+
+        def register(subject, schema):
+            if subject == "bad-topic-value":
+                raise Exception("Invalid schema")
+            return 1
+
+        mock_registry_client.register_schema.side_effect = register
+
+        validator.schema_registry_client = mock_registry_client
+        with pytest.raises(SchemaRegistryError, match="Failed to register schema for bad-topic-value"):
+            validator.register_schemas([("user-topic-value", schema), ("bad-topic-value", schema)])
+
+        assert validator.register_schema("user-topic-value", schema) == 1
+        assert mock_registry_client.register_schema.call_count == 2
+
+    def test_delete_schema_version_forgets_registrations(self, validator, mock_registry_client):
+        """Test that deleting a version makes the next registration hit the registry."""
+        schema = {"type": "record", "name": "User", "fields": []}
+        mock_registry_client.register_schema.return_value = 1
+        mock_registry_client.delete_schema_version.return_value = True
+
+        validator.schema_registry_client = mock_registry_client
+        validator.register_schema("user-topic-value", schema)
+        validator.delete_schema_version("user-topic-value", 1)
+        validator.register_schema("user-topic-value", schema)
+
+        assert mock_registry_client.register_schema.call_count == 2
+
+    def test_failed_registry_reads_are_not_cached(self, validator, mock_registry_client):
+        """Test that a failed read is retried on the next call."""
+        mock_registry_client.get_schema_by_id.side_effect = [Exception("Timeout"), {"type": "string"}]
+
+        validator.schema_registry_client = mock_registry_client
+        with pytest.raises(SchemaRegistryError):
+            validator.get_schema_by_id(1)
+
+        assert validator.get_schema_by_id(1) == {"type": "string"}
+
+    def test_registry_cache_disabled_with_zero_ttl(self, mock_registry_client):
+        """Test that a zero TTL sends every read to the registry."""
+        validator = SchemaValidator(registry_cache_ttl=0)
+        mock_registry_client.list_subjects.return_value = []
+
+        validator.schema_registry_client = mock_registry_client
+        validator.list_subjects()
+        validator.list_subjects()
+
+        assert mock_registry_client.list_subjects.call_count == 2
+
     def test_schema_registry_client_not_configured(self, validator):
         """Test graceful handling when Schema Registry client is not configured."""
-        from src.utils.schema_validator import SchemaRegistryError
-
         # No client configured
         validator.schema_registry_client = None
 
@@ -738,169 +1715,131 @@ class TestSchemaRegistryIntegration:
         assert result is True
         mock_registry_client.set_compatibility.assert_called_once_with("user-topic-value", "FULL")
 
-    def test_simple_registry_client_initialization(self, validator_with_registry_url):
-        """Test that SimpleSchemaRegistryClient is initialized with registry URL."""
-        assert validator_with_registry_url.schema_registry_client is not None
-        assert validator_with_registry_url.schema_registry_url == "http://localhost:8081"
-
-    def test_simple_registry_client_get_schema_by_id(self, mocker):
-        """Test SimpleSchemaRegistryClient.get_schema_by_id method."""
-        mock_response = mocker.Mock()
-        mock_response.json.return_value = {"schema": {"type": "record", "name": "Test", "fields": []}}
-        mock_session = mocker.Mock()
-        mock_session.get.return_value = mock_response
-        mocker.patch('requests.Session', return_value=mock_session)
+    def test_requests_imported_only_for_registry_client(self):
+        """Test that importing the module alone does not load requests."""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = "import sys, src.utils.schema_validator; print('requests' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_custom_session_does_not_load_requests(self):
+        """Test that a client given another HTTP session never imports requests."""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        # The session is defined inline: importing this test module would
+        # pull in its own dependencies and say nothing about the client's
+        code = (
+            "import sys\n"
+            "from src.utils.schema_validator import SimpleSchemaRegistryClient\n"
+            "class Response:\n"
+            "    content = b'[\"a\"]'\n"
+            "    def raise_for_status(self):\n"
+            "        pass\n"
+            "    def json(self):\n"
+            "        return ['a']\n"
+            "class Session:\n"
+            "    headers = {}\n"
+            "    def get(self, url, **kwargs):\n"
+            "        return Response()\n"
+            "client = SimpleSchemaRegistryClient('http://registry:8081', session=Session())\n"
+            "assert client.list_subjects() == ['a']\n"
+            "print('requests' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        assert result.stdout.strip() == "False"
 
-        validator = SchemaValidator(schema_registry_url="http://localhost:8081")
-        result = validator.schema_registry_client.get_schema_by_id(42)
-
-        assert result == {"type": "record", "name": "Test", "fields": []}
-        mock_session.get.assert_called_once_with("http://localhost:8081/schemas/ids/42")
-
-    def test_simple_registry_client_get_latest_schema_version(self, mocker):
-        """Test SimpleSchemaRegistryClient.get_latest_schema_version method."""
-        schema = {"type": "record", "name": "Test", "fields": []}
-        mock_response = mocker.Mock()
-        mock_response.json.return_value = {"version": 5, "schema": json.dumps(schema)}
-        mock_session = mocker.Mock()
-        mock_session.get.return_value = mock_response
-        mocker.patch('requests.Session', return_value=mock_session)
+    @pytest.fixture
+    def shared_sessions(self):
+        """Start and end a test with no shared registry sessions."""
+        from src.utils.schema_validator import close_shared_sessions
 
-        validator = SchemaValidator(schema_registry_url="http://localhost:8081")
-        version, result = validator.schema_registry_client.get_latest_schema_version("test-subject")
+        close_shared_sessions()
+        yield
+        close_shared_sessions()
 
-        assert version == 5
-        assert result == schema
-        mock_session.get.assert_called_once_with("http://localhost:8081/subjects/test-subject/versions/latest")
+    def test_simple_registry_client_pools_connections(self, shared_sessions):
+        """Test that the default session keeps a connection pool with retries."""
+        from src.utils.schema_validator import SimpleSchemaRegistryClient
 
-    def test_simple_registry_client_get_all_versions(self, mocker):
-        """Test SimpleSchemaRegistryClient.get_all_versions method."""
-        schema1 = {"type": "record", "name": "Test", "fields": []}
-        schema2 = {"type": "record", "name": "Test", "fields": [{"name": "id", "type": "string"}]}
+        client = SimpleSchemaRegistryClient("http://localhost:8081/")
+        adapter = client.session.get_adapter("http://localhost:8081")
 
-        mock_versions_response = mocker.Mock()
-        mock_versions_response.json.return_value = [1, 2]
+        assert client.url == "http://localhost:8081"
+        assert adapter._pool_maxsize == 50
+        assert adapter.max_retries.total == 3
 
-        mock_v1_response = mocker.Mock()
-        mock_v1_response.json.return_value = {"version": 1, "schema": json.dumps(schema1)}
+    def test_simple_registry_clients_share_session_per_url(self, shared_sessions):
+        """Test that clients of the same registry reuse one session."""
+        from src.utils.schema_validator import SimpleSchemaRegistryClient
 
-        mock_v2_response = mocker.Mock()
-        mock_v2_response.json.return_value = {"version": 2, "schema": json.dumps(schema2)}
+        client1 = SimpleSchemaRegistryClient("http://localhost:8081")
+        client2 = SimpleSchemaRegistryClient("http://localhost:8081/")
+        other = SimpleSchemaRegistryClient("http://localhost:8082")
 
-        mock_session = mocker.Mock()
-        mock_session.get.side_effect = [mock_versions_response, mock_v1_response, mock_v2_response]
-        mocker.patch('requests.Session', return_value=mock_session)
-
-        validator = SchemaValidator(schema_registry_url="http://localhost:8081")
-        results = validator.schema_registry_client.get_all_versions("test-subject")
-
-        assert len(results) == 2
-        assert results[0] == (1, schema1)
-        assert results[1] == (2, schema2)
+        assert client1.session is client2.session
+        assert other.session is not client1.session
 
-    def test_simple_registry_client_register_schema(self, mocker):
-        """Test SimpleSchemaRegistryClient.register_schema method."""
-        schema = {"type": "record", "name": "Test", "fields": []}
-        mock_response = mocker.Mock()
-        mock_response.json.return_value = {"id": 123}
-        mock_session = mocker.Mock()
-        mock_session.post.return_value = mock_response
-        mocker.patch('requests.Session', return_value=mock_session)
+    def test_shared_sessions_bounded(self, shared_sessions, monkeypatch):
+        """Test that only the most recently used registries keep a shared session."""
+        from src.utils import schema_validator
+        from src.utils.schema_validator import SimpleSchemaRegistryClient
 
-        validator = SchemaValidator(schema_registry_url="http://localhost:8081")
-        schema_id = validator.schema_registry_client.register_schema("test-subject", schema)
+        monkeypatch.setattr(schema_validator, "_SHARED_SESSION_CACHE_SIZE", 2)
+        first = SimpleSchemaRegistryClient("http://registry-1:8081")
+        SimpleSchemaRegistryClient("http://registry-2:8081")
+        third = SimpleSchemaRegistryClient("http://registry-3:8081")
 
-        assert schema_id == 123
-        mock_session.post.assert_called_once()
+        assert SimpleSchemaRegistryClient("http://registry-3:8081").session is third.session
+        assert SimpleSchemaRegistryClient("http://registry-1:8081").session is not first.session
 
-    def test_simple_registry_client_test_compatibility(self, mocker):
-        """Test SimpleSchemaRegistryClient.test_compatibility method."""
-        schema = {"type": "record", "name": "Test", "fields": []}
-        mock_response = mocker.Mock()
-        mock_response.json.return_value = {"is_compatible": True}
-        mock_session = mocker.Mock()
-        mock_session.post.return_value = mock_response
-        mocker.patch('requests.Session', return_value=mock_session)
+    def test_close_shared_sessions(self, shared_sessions, mocker):
+        """Test that closing shared sessions closes them and later clients get new ones."""
+        from src.utils.schema_validator import SimpleSchemaRegistryClient, close_shared_sessions
 
-        validator = SchemaValidator(schema_registry_url="http://localhost:8081")
-        result = validator.schema_registry_client.test_compatibility("test-subject", schema)
+        client = SimpleSchemaRegistryClient("http://localhost:8081")
+        close = mocker.spy(client.session, "close")
 
-        assert result is True
-        mock_session.post.assert_called_once()
+        close_shared_sessions()
 
-    def test_simple_registry_client_get_schema_by_version(self, mocker):
-        """Test SimpleSchemaRegistryClient.get_schema_by_version method."""
-        schema = {"type": "record", "name": "Test", "fields": []}
-        mock_response = mocker.Mock()
-        mock_response.json.return_value = {"schema": json.dumps(schema)}
-        mock_session = mocker.Mock()
-        mock_session.get.return_value = mock_response
-        mocker.patch('requests.Session', return_value=mock_session)
-
-        validator = SchemaValidator(schema_registry_url="http://localhost:8081")
-        result = validator.schema_registry_client.get_schema_by_version("test-subject", 3)
-
-        assert result == schema
-        mock_session.get.assert_called_once_with("http://localhost:8081/subjects/test-subject/versions/3")
-
-    def test_simple_registry_client_list_subjects(self, mocker):
-        """Test SimpleSchemaRegistryClient.list_subjects method."""
-        mock_response = mocker.Mock()
-        mock_response.json.return_value = ["subject1", "subject2", "subject3"]
-        mock_session = mocker.Mock()
-        mock_session.get.return_value = mock_response
-        mocker.patch('requests.Session', return_value=mock_session)
-
-        validator = SchemaValidator(schema_registry_url="http://localhost:8081")
-        subjects = validator.schema_registry_client.list_subjects()
-
-        assert subjects == ["subject1", "subject2", "subject3"]
-        mock_session.get.assert_called_once_with("http://localhost:8081/subjects")
-
-    def test_simple_registry_client_delete_schema_version(self, mocker):
-        """Test SimpleSchemaRegistryClient.delete_schema_version method."""
-        mock_response = mocker.Mock()
-        mock_session = mocker.Mock()
-        mock_session.delete.return_value = mock_response
-        mocker.patch('requests.Session', return_value=mock_session)
-
-        validator = SchemaValidator(schema_registry_url="http://localhost:8081")
-        result = validator.schema_registry_client.delete_schema_version("test-subject", 2)
+        close.assert_called_once_with()
+        assert SimpleSchemaRegistryClient("http://localhost:8081").session is not client.session
 
-        assert result is True
-        mock_session.delete.assert_called_once_with("http://localhost:8081/subjects/test-subject/versions/2")
+    def test_simple_registry_client_uses_given_session(self, mocker):
+        """Test that a caller-provided session is used instead of a new one."""
+        from src.utils.schema_validator import SimpleSchemaRegistryClient
 
-    def test_simple_registry_client_get_compatibility(self, mocker):
-        """Test SimpleSchemaRegistryClient.get_compatibility method."""
-        mock_response = mocker.Mock()
-        mock_response.json.return_value = {"compatibilityLevel": "FULL"}
-        mock_session = mocker.Mock()
-        mock_session.get.return_value = mock_response
-        mocker.patch('requests.Session', return_value=mock_session)
+        session_factory = mocker.patch('src.utils.schema_validator._get_shared_session')
+        shared_session = mocker.Mock()
+        shared_session.headers = {}
 
-        validator = SchemaValidator(schema_registry_url="http://localhost:8081")
-        level = validator.schema_registry_client.get_compatibility("test-subject")
+        client1 = SimpleSchemaRegistryClient("http://localhost:8081", session=shared_session)
+        client2 = SimpleSchemaRegistryClient("http://localhost:8081", session=shared_session)
 
-        assert level == "FULL"
-        mock_session.get.assert_called_once_with("http://localhost:8081/config/test-subject")
-
-    def test_simple_registry_client_set_compatibility(self, mocker):
-        """Test SimpleSchemaRegistryClient.set_compatibility method."""
-        mock_response = mocker.Mock()
-        mock_session = mocker.Mock()
-        mock_session.put.return_value = mock_response
-        mocker.patch('requests.Session', return_value=mock_session)
-
-        validator = SchemaValidator(schema_registry_url="http://localhost:8081")
-        result = validator.schema_registry_client.set_compatibility("test-subject", "BACKWARD")
-
-        assert result is True
-        mock_session.put.assert_called_once_with("http://localhost:8081/config/test-subject", json={"compatibility": "BACKWARD"})
+        assert client1.session is client2.session is shared_session
+        session_factory.assert_not_called()
+        assert not hasattr(client1, "__dict__")
 
     def test_get_latest_schema_version_error(self, validator, mock_registry_client):
         """Test error handling when getting latest schema version fails."""
-        from src.utils.schema_validator import SchemaRegistryError
-
         mock_registry_client.get_latest_schema_version.side_effect = Exception("Connection failed")
 
         validator.schema_registry_client = mock_registry_client
@@ -910,8 +1849,6 @@ class TestSchemaRegistryIntegration:
 
     def test_get_all_schema_versions_error(self, validator, mock_registry_client):
         """Test error handling when getting all versions fails."""
-        from src.utils.schema_validator import SchemaRegistryError
-
         mock_registry_client.get_all_versions.side_effect = Exception("Network error")
 
         validator.schema_registry_client = mock_registry_client
@@ -921,8 +1858,6 @@ class TestSchemaRegistryIntegration:
 
     def test_register_schema_error(self, validator, mock_registry_client):
         """Test error handling when registering schema fails."""
-        from src.utils.schema_validator import SchemaRegistryError
-
         schema = {"type": "record", "name": "Test", "fields": []}
         mock_registry_client.register_schema.side_effect = Exception("Registration failed")
 
@@ -933,8 +1868,6 @@ class TestSchemaRegistryIntegration:
 
     def test_test_compatibility_with_registry_error(self, validator, mock_registry_client):
         """Test error handling when compatibility test fails."""
-        from src.utils.schema_validator import SchemaRegistryError
-
         schema = {"type": "record", "name": "Test", "fields": []}
         mock_registry_client.test_compatibility.side_effect = Exception("Test failed")
 
@@ -945,8 +1878,6 @@ class TestSchemaRegistryIntegration:
 
     def test_get_schema_diff_error(self, validator, mock_registry_client):
         """Test error handling when getting schema diff fails."""
-        from src.utils.schema_validator import SchemaRegistryError
-
         mock_registry_client.get_schema_by_version.side_effect = Exception("Version not found")
 
         validator.schema_registry_client = mock_registry_client
@@ -956,8 +1887,6 @@ class TestSchemaRegistryIntegration:
 
     def test_list_subjects_error(self, validator, mock_registry_client):
         """Test error handling when listing subjects fails."""
-        from src.utils.schema_validator import SchemaRegistryError
-
         mock_registry_client.list_subjects.side_effect = Exception("Permission denied")
 
         validator.schema_registry_client = mock_registry_client
@@ -967,8 +1896,6 @@ class TestSchemaRegistryIntegration:
 
     def test_delete_schema_version_error(self, validator, mock_registry_client):
         """Test error handling when deleting schema version fails."""
-        from src.utils.schema_validator import SchemaRegistryError
-
         mock_registry_client.delete_schema_version.side_effect = Exception("Delete failed")
 
         validator.schema_registry_client = mock_registry_client
@@ -978,8 +1905,6 @@ class TestSchemaRegistryIntegration:
 
     def test_get_registry_compatibility_mode_error(self, validator, mock_registry_client):
         """Test error handling when getting compatibility mode fails."""
-        from src.utils.schema_validator import SchemaRegistryError
-
         mock_registry_client.get_compatibility.side_effect = Exception("Config error")
 
         validator.schema_registry_client = mock_registry_client
@@ -989,8 +1914,6 @@ class TestSchemaRegistryIntegration:
 
     def test_set_registry_compatibility_mode_error(self, validator, mock_registry_client):
         """Test error handling when setting compatibility mode fails."""
-        from src.utils.schema_validator import SchemaRegistryError
-
         mock_registry_client.set_compatibility.side_effect = Exception("Update failed")
 
         validator.schema_registry_client = mock_registry_client
@@ -999,15 +1922,345 @@ class TestSchemaRegistryIntegration:
             validator.set_registry_compatibility_mode("test-subject", CompatibilityMode.FULL)
 
 
+class TestSimpleSchemaRegistryClient:
+    """Test the HTTP Schema Registry client against a fake session."""
+
+    @pytest.fixture(autouse=True)
+    def fake_session(self, monkeypatch):
+        """Route every registry client to one fake session, preventing HTTP calls."""
+        from src.utils import schema_validator
+
+        session = FakeSession()
+        monkeypatch.setattr(schema_validator, "_get_shared_session", lambda url: session)
+        return session
+
+    @pytest.fixture
+    def validator_with_registry_url(self):
+        """Create a SchemaValidator instance with schema registry URL."""
+        return SchemaValidator(schema_registry_url="http://localhost:8081")
+
+    @pytest.fixture
+    def registry_client(self, validator_with_registry_url):
+        """Get the HTTP registry client of a validator wired to the fake session."""
+        return validator_with_registry_url.schema_registry_client
+
+    def test_simple_registry_client_initialization(self, validator_with_registry_url):
+        """Test that SimpleSchemaRegistryClient is initialized with registry URL."""
+        assert validator_with_registry_url.schema_registry_client is not None
+        assert validator_with_registry_url.schema_registry_url == "http://localhost:8081"
+
+    @pytest.mark.parametrize("verb,method,args,body,expected,path", [
+        pytest.param(
+            "GET", "get_schema_by_id", (42,), {"schema": REGISTRY_SCHEMA},
+            REGISTRY_SCHEMA, "/schemas/ids/42", id="get_schema_by_id"
+        ),
+        pytest.param(
+            "GET", "get_latest_schema_version", ("test-subject",),
+            {"version": 5, "schema": json.dumps(REGISTRY_SCHEMA)},
+            (5, REGISTRY_SCHEMA), "/subjects/test-subject/versions/latest",
+            id="get_latest_schema_version"
+        ),
+        pytest.param(
+            "POST", "register_schema", ("test-subject", REGISTRY_SCHEMA), {"id": 123},
+            123, "/subjects/test-subject/versions", id="register_schema"
+        ),
+        pytest.param(
+            "POST", "test_compatibility", ("test-subject", REGISTRY_SCHEMA), {"is_compatible": True},
+            True, "/compatibility/subjects/test-subject/versions/latest", id="test_compatibility"
+        ),
+        pytest.param(
+            "GET", "get_schema_by_version", ("test-subject", 3), {"schema": json.dumps(REGISTRY_SCHEMA)},
+            REGISTRY_SCHEMA, "/subjects/test-subject/versions/3", id="get_schema_by_version"
+        ),
+        pytest.param(
+            "GET", "list_subjects", (), ["subject1", "subject2", "subject3"],
+            ["subject1", "subject2", "subject3"], "/subjects", id="list_subjects"
+        ),
+        pytest.param(
+            "DELETE", "delete_schema_version", ("test-subject", 2), None,
+            True, "/subjects/test-subject/versions/2", id="delete_schema_version"
+        ),
+        pytest.param(
+            "GET", "get_compatibility", ("test-subject",), {"compatibilityLevel": "FULL"},
+            "FULL", "/config/test-subject", id="get_compatibility"
+        ),
+        pytest.param(
+            "PUT", "set_compatibility", ("test-subject", "BACKWARD"), {"compatibility": "BACKWARD"},
+            True, "/config/test-subject", id="set_compatibility"
+        ),
+    ])
+    def test_simple_registry_client_request(
+        self, registry_client, fake_session, verb, method, args, body, expected, path
+    ):
+        """Test that each SimpleSchemaRegistryClient method makes one request and decodes it."""
+        url = "http://localhost:8081" + path
+        fake_session.routes[url] = body
+
+        result = getattr(registry_client, method)(*args)
+
+        assert result == expected
+        assert [(call_verb, call_url) for call_verb, call_url, _ in fake_session.calls] == [(verb, url)]
+
+    def test_simple_registry_client_register_schema_payload(self, registry_client, fake_session):
+        """Test that register_schema sends the schema as embedded JSON text."""
+        schema = {"type": "record", "name": "Café", "fields": [{"name": "id", "type": "string"}]}
+        url = "http://localhost:8081/subjects/test-subject/versions"
+        fake_session.routes[url] = {"id": 1}
+
+        registry_client.register_schema("test-subject", schema)
+
+        (_, _, kwargs), = fake_session.calls
+        assert json.loads(kwargs["json"]["schema"]) == schema
+
+    def test_simple_registry_client_set_compatibility_payload(self, registry_client, fake_session):
+        """Test that set_compatibility sends the level in the request body."""
+        url = "http://localhost:8081/config/test-subject"
+        fake_session.routes[url] = {"compatibility": "BACKWARD"}
+
+        registry_client.set_compatibility("test-subject", "BACKWARD")
+
+        assert fake_session.calls == [("PUT", url, {"json": {"compatibility": "BACKWARD"}})]
+
+    def test_simple_registry_client_get_all_versions(self, registry_client, fake_session):
+        """Test SimpleSchemaRegistryClient.get_all_versions method."""
+        schema1 = {"type": "record", "name": "Test", "fields": []}
+        schema2 = {"type": "record", "name": "Test", "fields": [{"name": "id", "type": "string"}]}
+
+        # Versions are fetched concurrently, so responses are resolved by URL
+        fake_session.routes.update({
+            "http://localhost:8081/subjects/test-subject/versions": [1, 2],
+            "http://localhost:8081/subjects/test-subject/versions/1": {"version": 1, "schema": json.dumps(schema1)},
+            "http://localhost:8081/subjects/test-subject/versions/2": {"version": 2, "schema": json.dumps(schema2)},
+        })
+
+        results = registry_client.get_all_versions("test-subject")
+
+        assert len(results) == 2
+        assert results[0] == (1, schema1)
+        assert results[1] == (2, schema2)
+
+    def test_simple_registry_client_get_all_versions_keeps_order(self, registry_client, fake_session):
+        """Test that concurrently fetched versions come back in registry order."""
+        import time
+
+        def version_body(url):
+            version = int(url.rsplit("/", 1)[1])
+            if version == 1:
+                time.sleep(0.05)  # finish last
+            return {"version": version, "schema": '{"type": "string"}'}
+
+        base = "http://localhost:8081/subjects/test-subject/versions"
+        fake_session.routes[base] = [1, 2, 3]
+        for version in (1, 2, 3):
+            fake_session.routes[f"{base}/{version}"] = version_body
+
+        results = registry_client.get_all_versions("test-subject")
+
+        assert [version for version, _ in results] == [1, 2, 3]
+
+    def test_response_json_decodes_raw_bytes(self):
+        """Test that registry responses with a bytes body are decoded from the bytes."""
+        import requests
+        from src.utils.schema_validator import _response_json
+
+        response = requests.Response()
+        response._content = b'{"id": 1, "schema": "{\\"type\\": \\"string\\"}"}'
+
+        assert _response_json(response) == {"id": 1, "schema": '{"type": "string"}'}
+        assert _response_json(FakeResponse({"id": 2})) == {"id": 2}
+
+    def test_simple_registry_client_reuses_schemas_by_id(self, registry_client, fake_session):
+        """Test that versions bound to the same schema ID share one parsed schema."""
+        schema_str = json.dumps({"type": "record", "name": "Test", "fields": []})
+        for subject in ("subject-a", "subject-b"):
+            fake_session.routes[f"http://localhost:8081/subjects/{subject}/versions/1"] = {
+                "id": 7, "version": 1, "schema": schema_str
+            }
+
+        schema_a = registry_client.get_schema_by_version("subject-a", 1)
+        schema_b = registry_client.get_schema_by_version("subject-b", 1)
+
+        assert schema_a == schema_b == json.loads(schema_str)
+        assert len(registry_client._parsed_id_cache) == 1
+
+    def test_simple_registry_client_returns_schema_copies(self, registry_client, fake_session):
+        """Test that mutating a returned schema does not change the cached one."""
+        schema = {"type": "record", "name": "Test", "fields": []}
+        fake_session.routes.update({
+            "http://localhost:8081/schemas/ids/42": {"schema": schema},
+            "http://localhost:8081/subjects/test-subject/versions": [1],
+            "http://localhost:8081/subjects/test-subject/versions/1": {
+                "id": 42, "version": 1, "schema": json.dumps(schema)
+            },
+            "http://localhost:8081/subjects/test-subject/versions/latest": {
+                "id": 42, "version": 1, "schema": json.dumps(schema)
+            },
+        })
+
+        getters = [
+            lambda: registry_client.get_schema_by_id(42),
+            lambda: registry_client.get_schema_by_version("test-subject", 1),
+            lambda: registry_client.get_latest_schema_version("test-subject")[1],
+            lambda: registry_client.get_all_versions("test-subject")[0][1],
+        ]
+        for get in getters:
+            get()["fields"].append({"name": "id", "type": "string"})
+            assert get() == {"type": "record", "name": "Test", "fields": []}
+
+    def test_simple_registry_client_caches_lookups(self, registry_client, fake_session):
+        """Test that schema ID and subject lookups are fetched once."""
+        schema = {"type": "record", "name": "Test", "fields": []}
+        fake_session.routes.update({
+            "http://localhost:8081/schemas/ids/42": {"schema": json.dumps(schema)},
+            "http://localhost:8081/subjects/test-subject/versions/latest": {
+                "version": 1, "schema": json.dumps(schema)
+            },
+        })
+
+        for _ in range(3):
+            registry_client.get_schema_by_id(42)
+            registry_client.get_latest_schema_version("test-subject")
+
+        assert len(fake_session.urls("GET")) == 2
+
+    def test_simple_registry_client_caches_subject_versions(self, registry_client, fake_session):
+        """Test that each numbered version is fetched once until deleted or cleared."""
+        base = "http://localhost:8081/subjects/test-subject/versions"
+        fake_session.routes.update({
+            base: [1, 2],
+            f"{base}/1": {"schema": '{"type": "string"}'},
+            f"{base}/2": {"schema": '{"type": "string"}'},
+        })
+
+        registry_client.get_all_versions("test-subject")
+        registry_client.get_schema_by_version("test-subject", 1)
+        registry_client.get_schema_by_version("test-subject", 2)
+        assert len(fake_session.urls("GET")) == 3
+
+        registry_client.delete_schema_version("test-subject", 2)
+        registry_client.get_schema_by_version("test-subject", 1)
+        registry_client.get_schema_by_version("test-subject", 2)
+        assert len(fake_session.urls("GET")) == 4
+
+        registry_client.clear_cache()
+        registry_client.get_schema_by_version("test-subject", 1)
+        assert len(fake_session.urls("GET")) == 5
+
+    def test_register_schemas_attempts_every_item_after_failure(
+        self, validator_with_registry_url, fake_session
+    ):
+        """Test that an early failure does not stop the rest of a large batch."""
+        subjects = [f"topic-{index}-value" for index in range(25)]
+
+        def register(url):
+            if "/topic-0-value/" in url:
+                raise Exception("Invalid schema")
+            return {"id": 1}
+
+        for subject in subjects:
+            fake_session.routes[f"http://localhost:8081/subjects/{subject}/versions"] = register
+
+        with pytest.raises(SchemaRegistryError, match="Failed to register schema for topic-0-value"):
+            validator_with_registry_url.register_schemas(
+                [(subject, REGISTRY_SCHEMA) for subject in subjects]
+            )
+
+        assert len(fake_session.urls("POST")) == len(subjects)
+
+    def test_register_schemas_posts_each_schema(self, validator_with_registry_url, fake_session):
+        """Test that a batch registration sends one request per schema."""
+        subjects = [f"topic-{index}-value" for index in range(5)]
+        for index, subject in enumerate(subjects):
+            fake_session.routes[f"http://localhost:8081/subjects/{subject}/versions"] = {"id": index}
+
+        result = validator_with_registry_url.register_schemas(
+            [(subject, REGISTRY_SCHEMA) for subject in subjects]
+        )
+
+        assert result == list(range(5))
+        assert len(fake_session.urls("POST")) == len(subjects)
+
+    def test_zero_registry_cache_ttl_reaches_registry_every_call(self, fake_session):
+        """Test that registry_cache_ttl=0 also turns off the built-in client's caches."""
+        schema = {"type": "record", "name": "Test", "fields": []}
+        latest_url = "http://localhost:8081/subjects/test-subject/versions/latest"
+        fake_session.routes.update({
+            latest_url: {"version": 1, "schema": json.dumps(schema)},
+            "http://localhost:8081/schemas/ids/42": {"schema": schema},
+        })
+
+        validator = SchemaValidator(schema_registry_url="http://localhost:8081", registry_cache_ttl=0)
+        assert validator.get_latest_schema_version("test-subject")[0] == 1
+        fake_session.routes[latest_url] = {"version": 2, "schema": json.dumps(schema)}
+        assert validator.get_latest_schema_version("test-subject")[0] == 2
+        validator.get_schema_by_id(42)
+        validator.get_schema_by_id(42)
+
+        assert len(fake_session.urls("GET")) == 4
+
+    def test_simple_registry_client_write_invalidates_subject(self, registry_client, fake_session):
+        """Test that registering a schema refreshes the subject's latest version."""
+        schema = {"type": "record", "name": "Test", "fields": []}
+        latest_url = "http://localhost:8081/subjects/test-subject/versions/latest"
+        fake_session.routes.update({
+            latest_url: {"version": 1, "schema": json.dumps(schema)},
+            "http://localhost:8081/subjects/test-subject/versions": {"id": 7},
+        })
+
+        assert registry_client.get_latest_schema_version("test-subject")[0] == 1
+        assert registry_client.get_latest_schema_version("test-subject")[0] == 1
+
+        fake_session.routes[latest_url] = {"version": 2, "schema": json.dumps(schema)}
+        registry_client.register_schema("test-subject", schema)
+
+        assert registry_client.get_latest_schema_version("test-subject")[0] == 2
+
+    def test_validator_leaves_read_caching_to_builtin_client(
+        self, validator_with_registry_url, fake_session
+    ):
+        """Test that reads through the built-in client are cached in the client only."""
+        fake_session.routes["http://localhost:8081/schemas/ids/42"] = {"schema": REGISTRY_SCHEMA}
+
+        validator_with_registry_url.get_schema_by_id(42)
+        validator_with_registry_url.get_schema_by_id(42)
+
+        assert len(fake_session.urls("GET")) == 1
+        assert len(validator_with_registry_url._registry_cache) == 0
+
+    def test_simple_registry_client_caches_subjects_and_config(self, registry_client, fake_session):
+        """Test that subject lists and compatibility levels are cached until a write."""
+        fake_session.routes.update({
+            "http://localhost:8081/subjects": ["test-subject"],
+            "http://localhost:8081/subjects/test-subject/versions": {"id": 7},
+            "http://localhost:8081/config/test-subject": {"compatibilityLevel": "BACKWARD"},
+        })
+
+        registry_client.list_subjects().append("other-subject")
+        assert registry_client.list_subjects() == ["test-subject"]
+        registry_client.register_schema("test-subject", REGISTRY_SCHEMA)
+        registry_client.list_subjects()
+        assert fake_session.urls("GET").count("http://localhost:8081/subjects") == 2
+
+        assert registry_client.get_compatibility("test-subject") == "BACKWARD"
+        assert registry_client.get_compatibility("test-subject") == "BACKWARD"
+        fake_session.routes["http://localhost:8081/config/test-subject"] = {"compatibilityLevel": "FULL"}
+        registry_client.set_compatibility("test-subject", "FULL")
+        assert registry_client.get_compatibility("test-subject") == "FULL"
+        assert fake_session.urls("GET").count("http://localhost:8081/config/test-subject") == 2
+
+
 class TestNamespaceValidation:
     """Test namespace validation (Bug #6)."""
 
-    @pytest.fixture
+    # Validation does not change a validator's behaviour, so one instance per
+    # mode is shared by every test in the class
+
+    @pytest.fixture(scope="class")
     def validator(self):
         """Create a SchemaValidator instance in normal mode."""
         return SchemaValidator()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def strict_validator(self):
         """Create a SchemaValidator instance in strict mode."""
         return SchemaValidator(strict_mode=True)
@@ -1023,11 +2276,8 @@ class TestNamespaceValidation:
 
         assert validator.validate_avro_schema(schema) is True
 
-    def test_schema_without_namespace_warns_in_normal_mode(self, validator, caplog):
+    def test_schema_without_namespace_warns_in_normal_mode(self, validator, warning_log):
         """Test that schema without namespace generates warning in normal mode."""
-        import logging
-        caplog.set_level(logging.WARNING)
-
         schema = {
             "type": "record",
             "name": "User",
@@ -1036,8 +2286,9 @@ class TestNamespaceValidation:
 
         # Should pass but generate warning
         assert validator.validate_avro_schema(schema) is True
-        assert "missing 'namespace' field" in caplog.text
-        assert "Namespaces prevent naming conflicts" in caplog.text
+        assert len(warning_log.messages) == 1
+        assert "missing 'namespace' field" in warning_log.messages[0]
+        assert "Namespaces prevent naming conflicts" in warning_log.messages[0]
 
     def test_schema_without_namespace_fails_in_strict_mode(self, strict_validator):
         """Test that schema without namespace raises error in strict mode."""
@@ -1053,7 +2304,7 @@ class TestNamespaceValidation:
         assert "missing 'namespace' field" in str(exc_info.value)
         assert "Namespaces prevent naming conflicts" in str(exc_info.value)
 
-    def test_namespace_warning_can_be_disabled(self, validator):
+    def test_namespace_warning_can_be_disabled(self, validator, warning_log):
         """Test that namespace warning can be disabled."""
         schema = {
             "type": "record",
@@ -1063,6 +2314,7 @@ class TestNamespaceValidation:
 
         # Should pass without warning when warn_missing_namespace=False
         assert validator.validate_avro_schema(schema, warn_missing_namespace=False) is True
+        assert warning_log.messages == []
 
     def test_strict_mode_initialization(self, strict_validator):
         """Test that strict mode is properly initialized."""
@@ -1095,3 +2347,22 @@ class TestNamespaceValidation:
         }
 
         assert validator.validate_avro_schema(schema) is True
+
+    def test_namespace_checked_on_top_level_only(self, strict_validator, warning_log):
+        """Test that nested records without a namespace pass once the top level has one."""
+        schema = {
+            "type": "record",
+            "name": "Order",
+            "namespace": "com.example.orders",
+            "fields": [{
+                "name": "customer",
+                "type": {
+                    "type": "record",
+                    "name": "Customer",
+                    "fields": [{"name": "customer_id", "type": "string"}]
+                }
+            }]
+        }
+
+        assert strict_validator.validate_avro_schema(schema) is True
+        assert warning_log.messages == []
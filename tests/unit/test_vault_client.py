@@ -6,12 +6,20 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from hvac.exceptions import VaultError, InvalidPath
 
+from src.utils import vault_client
 from src.utils.vault_client import VaultClient, HealthStatus
 
 
 class TestVaultClient:
     """Test suite for VaultClient class."""
 
+    @pytest.fixture(autouse=True)
+    def clear_client_cache(self):
+        """Start every test without shared hvac clients."""
+        vault_client.clear_client_cache()
+        yield
+        vault_client.clear_client_cache()
+
     @pytest.fixture
     def mock_hvac_client(self):
         """Mock hvac.Client for testing."""
@@ -62,6 +70,56 @@ class TestVaultClient:
         with pytest.raises(VaultError, match="Failed to authenticate"):
             VaultClient(vault_url="http://test:8200", vault_token="bad-token")
 
+    def test_init_reuses_authenticated_client(self, mock_hvac_client):
+        """Test that clients with the same settings share one hvac client."""
+        client1 = VaultClient(vault_url="http://test:8200", vault_token="test-token")
+        client2 = VaultClient(vault_url="http://test:8200", vault_token="test-token")
+
+        assert client1.client is client2.client
+        mock_hvac_client.assert_called_once()
+        client1.client.is_authenticated.assert_called_once()
+
+    def test_init_rechecks_shared_client_after_ttl(self, mock_hvac_client, monkeypatch):
+        """Test that a shared client's token is re-checked once the TTL has passed."""
+        monkeypatch.setattr(vault_client, "_AUTH_CHECK_TTL", 0)
+
+        client1 = VaultClient(vault_url="http://test:8200", vault_token="test-token")
+        VaultClient(vault_url="http://test:8200", vault_token="test-token")
+
+        mock_hvac_client.assert_called_once()
+        assert client1.client.is_authenticated.call_count == 2
+
+    def test_init_separates_clients_by_token(self, mock_hvac_client):
+        """Test that a different token gets its own hvac client."""
+        VaultClient(vault_url="http://test:8200", vault_token="token-a")
+        VaultClient(vault_url="http://test:8200", vault_token="token-b")
+
+        assert mock_hvac_client.call_count == 2
+        assert all("token-" not in str(key) for key in vault_client._client_cache)
+
+    def test_init_replaces_client_that_lost_authentication(self, mock_hvac_client, monkeypatch):
+        """Test that a cached client whose token stopped working is replaced."""
+        monkeypatch.setattr(vault_client, "_AUTH_CHECK_TTL", 0)
+        stale = VaultClient(vault_url="http://test:8200", vault_token="test-token").client
+        stale.is_authenticated.return_value = False
+        fresh = MagicMock()
+        fresh.is_authenticated.return_value = True
+        mock_hvac_client.return_value = fresh
+
+        client = VaultClient(vault_url="http://test:8200", vault_token="test-token")
+
+        assert client.client is fresh
+        assert mock_hvac_client.call_count == 2
+
+    def test_init_authentication_failure_not_cached(self, mock_hvac_client):
+        """Test that a client that failed to authenticate is not shared."""
+        mock_hvac_client.return_value.is_authenticated.return_value = False
+
+        with pytest.raises(VaultError):
+            VaultClient(vault_url="http://test:8200", vault_token="bad-token")
+
+        assert not vault_client._client_cache
+
     def test_get_secret_success(self, mock_hvac_client):
         """Test successful secret retrieval."""
         mock_client = mock_hvac_client.return_value
@@ -78,11 +136,52 @@ class TestVaultClient:
         secret = client.get_secret("test-credentials")
 
         assert secret == {"username": "testuser", "password": "testpass"}
+        assert client.get_secret("test-credentials") == secret
         mock_client.secrets.kv.v2.read_secret_version.assert_called_once_with(
             path="test-credentials",
             mount_point="secret"
         )
 
+    def test_get_secret_cache_returns_copies(self, mock_hvac_client):
+        """Test that changing a returned secret does not change the cached one."""
+        mock_client = mock_hvac_client.return_value
+        mock_client.secrets.kv.v2.read_secret_version.return_value = {
+            "data": {"data": {"username": "testuser"}}
+        }
+
+        client = VaultClient(vault_url="http://test:8200", vault_token="test-token")
+        client.get_secret("test-credentials")["username"] = "changed"
+
+        assert client.get_secret("test-credentials") == {"username": "testuser"}
+
+    def test_invalidate_rereads_secret(self, mock_hvac_client):
+        """Test that invalidating a path reads the rotated secret from Vault."""
+        mock_client = mock_hvac_client.return_value
+        mock_client.secrets.kv.v2.read_secret_version.side_effect = [
+            {"data": {"data": {"password": "old"}}},
+            {"data": {"data": {"password": "new"}}},
+        ]
+
+        client = VaultClient(vault_url="http://test:8200", vault_token="test-token")
+        assert client.get_secret("test-credentials") == {"password": "old"}
+
+        client.invalidate("test-credentials")
+
+        assert client.get_secret("test-credentials") == {"password": "new"}
+
+    def test_secret_cache_disabled_with_zero_ttl(self, mock_hvac_client):
+        """Test that a zero TTL reads every secret from Vault."""
+        mock_client = mock_hvac_client.return_value
+        mock_client.secrets.kv.v2.read_secret_version.return_value = {
+            "data": {"data": {"username": "testuser"}}
+        }
+
+        client = VaultClient(vault_url="http://test:8200", vault_token="test-token", secret_cache_ttl=0)
+        client.get_secret("test-credentials")
+        client.get_secret("test-credentials")
+
+        assert mock_client.secrets.kv.v2.read_secret_version.call_count == 2
+
     def test_get_secret_not_found(self, mock_hvac_client):
         """Test secret retrieval with invalid path."""
         mock_client = mock_hvac_client.return_value
@@ -120,6 +219,10 @@ class TestVaultClient:
 
         assert creds["username"] == "scylla-user"
         assert creds["password"] == "scylla-pass"
+        mock_client.secrets.kv.v2.read_secret_version.assert_called_once_with(
+            path="scylla-credentials",
+            mount_point="secret"
+        )
 
     def test_get_database_credentials_postgres(self, mock_hvac_client):
         """Test retrieving PostgreSQL credentials."""
@@ -143,7 +246,7 @@ class TestVaultClient:
         """Test that invalid database name raises ValueError."""
         client = VaultClient(vault_url="http://test:8200", vault_token="test-token")
 
-        with pytest.raises(ValueError, match="Invalid database"):
+        with pytest.raises(ValueError, match=r"Invalid database: invalid\. Must be one of \['scylla', 'postgres'\]"):
             client.get_database_credentials("invalid")
 
     def test_get_scylla_credentials(self, mock_hvac_client):
@@ -223,6 +326,29 @@ class TestVaultClient:
         assert not status  # Can use in if not statements
         assert bool(status) is False
 
+    def test_health_check_trusts_recent_authentication(self, mock_hvac_client):
+        """Test that back-to-back health checks verify the token once."""
+        mock_client = mock_hvac_client.return_value
+        mock_client.sys.read_health_status.return_value = {"sealed": False}
+
+        client = VaultClient(vault_url="http://test:8200", vault_token="test-token")
+        mock_client.is_authenticated.reset_mock()
+
+        assert client.health_check()
+        assert client.health_check()
+        mock_client.is_authenticated.assert_called_once()
+
+    def test_health_check_rechecks_failed_authentication(self, mock_hvac_client):
+        """Test that a failed authentication check is not trusted."""
+        client = VaultClient(vault_url="http://test:8200", vault_token="test-token")
+        mock_client = mock_hvac_client.return_value
+        mock_client.is_authenticated.reset_mock()
+        mock_client.is_authenticated.return_value = False
+
+        assert not client.health_check()
+        assert not client.health_check()
+        assert mock_client.is_authenticated.call_count == 2
+
     def test_health_check_sealed(self, mock_hvac_client):
         """Test health check with sealed Vault."""
         mock_client = mock_hvac_client.return_value
@@ -301,6 +427,25 @@ class TestVaultClient:
         client.close()
         assert client.client is None
 
+    def test_close_evicts_shared_client(self, mock_hvac_client):
+        """Test that closing drops the shared client, leaving other instances working."""
+        client1 = VaultClient(vault_url="http://test:8200", vault_token="test-token")
+        client2 = VaultClient(vault_url="http://test:8200", vault_token="test-token")
+
+        client1.close()
+        VaultClient(vault_url="http://test:8200", vault_token="test-token")
+
+        assert client2.client is not None
+        assert mock_hvac_client.call_count == 2
+
+    def test_clear_client_cache(self, mock_hvac_client):
+        """Test that clearing the shared cache makes new instances authenticate afresh."""
+        VaultClient(vault_url="http://test:8200", vault_token="test-token")
+        vault_client.clear_client_cache()
+        VaultClient(vault_url="http://test:8200", vault_token="test-token")
+
+        assert mock_hvac_client.call_count == 2
+
     def test_get_secret_retrieval_error(self, mock_hvac_client):
         """Test handling of generic errors during secret retrieval."""
         from hvac.exceptions import VaultError